@@ -4,16 +4,22 @@
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path so we can import dose_every_well
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from dose_every_well.cnc_controller import CNC_Controller, load_config, find_port
 
+# The "Before" reads repeat the previous "After" position; CNC_VERBOSE=1 shows them
+VERBOSE = os.environ.get("CNC_VERBOSE") == "1"
+
 
 def main():
     """Main demo function"""
     print("=== Liquid CNC Axis Movement Demo ===")
+    # Background worker for serial reads that can overlap the operator prompt
+    executor = ThreadPoolExecutor(max_workers=1)
     
     try:
         # Load configuration and initialize controller
@@ -34,29 +40,35 @@ def main():
             
             # Test X-axis movement
             print(f"\n--- Moving X-axis by {steps} steps ({steps * step_size} mm) ---")
-            print_coordinates(controller, "Before X movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before X movement")
             controller.move_to_point(steps * step_size, 0)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After X movement")
             
             # Test Y-axis movement
             print(f"\n--- Moving Y-axis by {steps} steps ({steps * step_size} mm) ---")
-            print_coordinates(controller, "Before Y movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before Y movement")
             controller.move_to_point(0, steps * step_size)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After Y movement")
             
             # Test Z-axis movement (be careful with Z!)
             print(f"\n--- Moving Z-axis by {steps} steps ({steps * step_size} mm) ---")
             print("WARNING: Z-axis movement - ensure tool is clear of workpiece!")
+            # Read the position while the operator is still at the prompt
+            if VERBOSE:
+                pending = executor.submit(controller.read_coordinates)
             input("Press Enter to continue with Z-axis movement...")
             
-            print_coordinates(controller, "Before Z movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before Z movement", pending)
             controller.move_to_height(steps * step_size)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After Z movement")
             
             print(f"\nCompleted testing with {steps} steps")
@@ -70,13 +82,20 @@ def main():
         print(f"Error during demo: {e}")
     
     finally:
+        executor.shutdown(wait=False)
         print("\nDemo finished. Exiting...")
 
 
-def print_coordinates(controller, step_name=""):
-    """Print current machine coordinates"""
+def wait_for_motion(controller):
+    """Block until the CNC reports Idle, falling back to a fixed delay on timeout"""
+    if not controller.wait_until_idle():
+        time.sleep(2)
+
+
+def print_coordinates(controller, step_name="", pending=None):
+    """Print current machine coordinates, or those from an already-submitted read"""
     try:
-        coords = controller.read_coordinates()
+        coords = pending.result() if pending else controller.read_coordinates()
         if coords:
             print(f"{step_name} - Current coordinates: X={coords['X']:.2f}, Y={coords['Y']:.2f}, Z={coords['Z']:.2f}")
         else:
@@ -10,6 +10,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from dose_every_well.cnc_controller import CNC_Controller, load_config, find_port
 
+# The "Before" reads repeat the previous "After" position; CNC_VERBOSE=1 shows them
+VERBOSE = os.environ.get("CNC_VERBOSE") == "1"
+
 
 def main():
     """Main demo function"""
@@ -34,26 +37,29 @@ def main():
             
             # Test X-axis movement
             print(f"\n--- Moving X-axis by {steps} steps ({steps * step_size} mm) ---")
-            print_coordinates(controller, "Before X movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before X movement")
             controller.move_to_point(steps * step_size, 0)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After X movement")
             
             # Test Y-axis movement
             print(f"\n--- Moving Y-axis by {steps} steps ({steps * step_size} mm) ---")
-            print_coordinates(controller, "Before Y movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before Y movement")
             controller.move_to_point(0, steps * step_size)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After Y movement")
             
             # Test Z-axis movement
             print(f"\n--- Moving Z-axis by {steps} steps ({steps * step_size} mm) ---")
-            print_coordinates(controller, "Before Z movement")
+            if VERBOSE:
+                print_coordinates(controller, "Before Z movement")
             controller.move_to_height(steps * step_size)
             controller.execute_movement()
-            time.sleep(2)
+            wait_for_motion(controller)
             print_coordinates(controller, "After Z movement")
             
             print(f"\nCompleted testing with {steps} steps")
@@ -70,6 +76,12 @@ def main():
         print("\nDemo finished. Exiting...")
 
 
+def wait_for_motion(controller):
+    """Block until the CNC reports Idle, falling back to a fixed delay on timeout"""
+    if not controller.wait_until_idle():
+        time.sleep(2)
+
+
 def print_coordinates(controller, step_name=""):
     """Print current machine coordinates"""
     try:
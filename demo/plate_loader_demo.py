@@ -15,6 +15,7 @@ Installation:
 import sys
 import os
 import time
+import traceback
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -26,7 +27,7 @@ except ImportError as e:
     print("\nInstall with:")
     print("  pip install -e '.[rpi]'")
     print("\nOr manually:")
-    print("  pip install adafruit-circuitpython-pca9685 adafruit-circuitpython-motor")
+    print("  pip install adafruit-circuitpython-pca9685")
     sys.exit(1)
 
 
@@ -159,7 +160,6 @@ def main():
     
     except Exception as e:
         print(f"\n✗ Error: {e}")
-        import traceback
         traceback.print_exc()
     
     finally:
@@ -15,8 +15,11 @@ Usage:
     python3 solid_doser_demo.py
 """
 
+import ctypes
+import os
 import sys
 import time
+import traceback
 from pathlib import Path
 
 # Add src to path for local development
@@ -25,6 +28,25 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from dose_every_well import SolidDoser
 
 
+def enable_realtime_scheduling(priority: int = 20):
+    """
+    Run this process under SCHED_FIFO with its memory locked, so timed
+    dispenses are not stretched by scheduler preemption or page faults.
+    Needs root (or CAP_SYS_NICE / CAP_IPC_LOCK); otherwise the demo
+    continues with normal scheduling.
+    """
+    if not hasattr(os, 'sched_setscheduler'):
+        return  # Not Linux
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except PermissionError:
+        print("Note: run as root for real-time scheduling (dispense timing may jitter)")
+        return
+    # MCL_CURRENT | MCL_FUTURE
+    if ctypes.CDLL(None, use_errno=True).mlockall(1 | 2) != 0:
+        print("Note: could not lock memory (mlockall failed)")
+
+
 def demo_basic_controls(doser: SolidDoser):
     """Demonstrate basic gate and motor controls"""
     print("\n" + "="*60)
@@ -199,6 +221,8 @@ def main():
     print("  - Note: Channels 3, 6, 9 reserved for plate_loader")
     print("\n" + "="*60)
     
+    enable_realtime_scheduling()
+    
     # Configuration
     i2c_address = 0x40  # Waveshare default
     motor_gpio = 17
@@ -278,7 +302,6 @@ def main():
         print("\n\nDemo interrupted by user")
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         if 'doser' in locals():
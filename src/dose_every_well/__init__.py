@@ -1,12 +1,37 @@
-from .cnc_controller import load_config, find_port, CNC_Controller, CNC_Simulator
-
-# Raspberry Pi hardware controllers (optional)
-try:
-    from .plate_loader import PlateLoader
-    from .solid_doser import SolidDoser
-    __all__ = ['load_config', 'find_port', 'CNC_Controller', 'CNC_Simulator', 'PlateLoader', 'SolidDoser']
-except (ImportError, NameError, Exception) as e:
-    # PlateLoader and SolidDoser require Raspberry Pi libraries or have dependency issues
-    import warnings
-    warnings.warn(f"Raspberry Pi hardware controllers not available: {e}", UserWarning)
-    __all__ = ['load_config', 'find_port', 'CNC_Controller', 'CNC_Simulator']
\ No newline at end of file
+import importlib
+import importlib.util
+
+from .well_plate import get_well_dict, well_traversal
+
+# Everything else is imported on first attribute access (PEP 562), so pure
+# geometry use doesn't pay for serial/matplotlib/yaml or the RPi libraries.
+_LAZY = {
+    'load_config': '.cnc_controller',
+    'find_port': '.cnc_controller',
+    'CNC_Controller': '.cnc_controller',
+    'CNC_Simulator': '.cnc_simulator',
+    'PlateLoader': '.plate_loader',
+    'SolidDoser': '.solid_doser',
+}
+
+# Raspberry Pi hardware controllers (optional). Check for the libraries
+# without importing them, so off-Pi star-imports don't reach for them.
+_RPI_LIBRARIES = ('board', 'busio', 'adafruit_pca9685', 'RPi')
+_rpi_available = all(importlib.util.find_spec(name) is not None for name in _RPI_LIBRARIES)
+
+__all__ = ['load_config', 'find_port', 'CNC_Controller', 'CNC_Simulator', 'get_well_dict', 'well_traversal']
+if _rpi_available:
+    __all__ += ['PlateLoader', 'SolidDoser']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        # Import errors propagate, e.g. SolidDoser without the RPi libraries
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
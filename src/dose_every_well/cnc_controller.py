@@ -1,10 +1,104 @@
+import array
+import contextlib
+import copy
+import functools
 import time
 import serial.tools.list_ports
-from threading import Event
-import matplotlib.pyplot as plt
-import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import yaml
 import os
+import queue
+import re
+import struct
+import sys
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# libyaml's C loader when PyYAML was built with it (pip wheels usually are)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# USB-serial bridges found on GRBL boards; None matches any product ID
+KNOWN_VIDPIDS = {
+    (0x2341, None),    # Arduino
+    (0x1A86, 0x7523),  # CH340
+    (0x10C4, 0xEA60),  # CP210x
+    (0x0403, None),    # FTDI
+}
+_ADAPTER_RE = re.compile(r"arduino|ch340|cp210|ftdi", re.I)
+
+# GRBL serial receive buffer size in bytes (character-counting streaming)
+RX_BUFFER_SIZE = 128
+
+# Fixed commands, encoded once instead of on every poll
+STATUS_QUERY = b"?"  # Real-time command: no newline, so no extra 'ok'
+WAKE_UP = b"\r\n\r\n"
+
+# Move templates, %-formatted straight to bytes for the G-code buffer
+_G0_XY_FMT = b"G0 X%.3f Y%.3f\n"
+_G0_Z_FMT = b"G0 Z%.3f\n"
+
+# Seconds a read_coordinates() result is reused for back-to-back calls
+POSITION_CACHE_TTL = 0.05
+
+# Machine position field of a GRBL status report: <Idle|MPos:x,y,z|...>
+_MPOS_RE = re.compile(rb'MPos:(-?\d+\.?\d*),(-?\d+\.?\d*),(-?\d+\.?\d*)')
+
+# Words that can move the machine: axis words (modal G0/G1 lines may omit the
+# G code), motion G codes incl. G28/G30 (go to stored position) and G38 (probe)
+_MOTION_RE = re.compile(r'[XYZ]|G0*(?:[0-3]|28|30|38)(?!\d)')
+
+# Program pause words: M0/M00, and M1/M01 (optional stop, which GRBL ignores),
+# matched after comments in parentheses or after ';' are removed
+_PAUSE_RE = re.compile(r'M0*[01](?!\d)')
+_COMMENT_RE = re.compile(r'\(.*?\)|;.*')
+
+# GRBL states in which a move is still making progress; any other non-Idle
+# state (Hold, Door, Check, Sleep) waits on something outside the program
+_MOVING_STATES = frozenset(('Run', 'Jog', 'Home'))
+
+# macOS IOSSDATALAT ioctl: _IOW('T', 0, unsigned long), value in microseconds
+IOSSDATALAT = 0x80085400
+
+# Linux serial_struct ioctls and the low-latency flag from <linux/serial.h>
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 1 << 13
+
+# Port picked by probing, keyed on the set of ports present when it was found
+_PROBED_PORT = {}
+
+
+def _set_low_latency(ser):
+    """Drop the USB-serial adapter's receive latency timer to 1 ms.
+
+    FTDI/CH340 adapters hold incoming bytes for up to 16 ms by default, which
+    is added to every '?' status reply and 'ok' acknowledgement. On Linux the
+    tty's ASYNC_LOW_LATENCY flag is set as well, which also covers drivers
+    without a sysfs latency_timer. Failures (no permission, unsupported
+    driver) are ignored.
+    """
+    if sys.platform.startswith('linux'):
+        device = os.path.basename(os.path.realpath(ser.port))
+        with contextlib.suppress(OSError):
+            with open(f"/sys/bus/usb-serial/devices/{device}/latency_timer", 'w') as f:
+                f.write('1')
+        with contextlib.suppress(OSError):
+            # struct serial_struct is read as ints; flags is the fifth field
+            buf = array.array('i', [0] * 32)
+            fcntl.ioctl(ser.fileno(), TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(ser.fileno(), TIOCSSERIAL, buf)
+    elif sys.platform == 'darwin' and fcntl is not None:
+        with contextlib.suppress(OSError):
+            fcntl.ioctl(ser.fileno(), IOSSDATALAT, struct.pack('L', 1000))
 
 
 def load_config(config_path, model_name):
@@ -14,10 +108,58 @@ def load_config(config_path, model_name):
     # Construct the full path to the config file
     full_config_path = os.path.join(script_dir, config_path)
     
-    with open(full_config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # Keyed on mtime and size so edits to the YAML file are still picked up,
+    # including a replacement that lands within the filesystem's mtime tick
+    st = os.stat(full_config_path)
+    config = _parse_config(full_config_path, st.st_mtime_ns, st.st_size)
     print(f"Configuration loaded for {model_name}.") 
-    return config['machines'][model_name]
+    return copy.deepcopy(config['machines'][model_name])
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config(full_config_path, mtime_ns, size):
+    """Parse a YAML config file once per (path, mtime, size)"""
+    with open(full_config_path, 'r') as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
+
+
+def _has_motion(program):
+    """Whether any line of a G-code program (or a single command) can move the machine"""
+    for line in program.upper().splitlines():
+        line = line.strip()
+        if line.startswith('$'):
+            # System commands: only homing ($H) and jogging ($J=) move
+            if line.startswith(('$H', '$J')):
+                return True
+        elif _MOTION_RE.search(line):
+            return True
+    return False
+
+
+def _is_pause(line):
+    """Whether a G-code line (str or bytes) contains a program pause word"""
+    if isinstance(line, bytes):
+        line = line.decode('ascii', 'ignore')
+    return _PAUSE_RE.search(_COMMENT_RE.sub('', line.upper())) is not None
+
+
+def _status_state(report):
+    """State name of a GRBL status report (b'<Hold:0|MPos:...>' -> 'Hold'), '' if empty"""
+    return report[1:].split(b'|', 1)[0].split(b':', 1)[0].decode('ascii', 'ignore')
+
+
+def _check_alarm(report):
+    """Raise RuntimeError if a status report is an alarm (GRBL flushed its buffer)"""
+    if report.startswith(b'<Alarm'):
+        raise RuntimeError(f"GRBL is in alarm state ({report.decode('utf-8', 'ignore')}); "
+                           "clear it with $X or home the machine")
+
+
+def _is_cnc_adapter(port):
+    """Whether a comports() entry looks like a GRBL board's USB-serial bridge"""
+    if port.vid is not None:
+        return (port.vid, port.pid) in KNOWN_VIDPIDS or (port.vid, None) in KNOWN_VIDPIDS
+    return bool(port.description and _ADAPTER_RE.search(port.description))
 
 
 def find_port():
@@ -33,56 +175,69 @@ def find_port():
 
     # If multiple ports found, try to identify the CNC
     print("Found multiple ports. Attempting to detect CNC...")
-    for port in ports:
-        try:
-            # Try to communicate with CNC
-            with serial.Serial(port.device, baudrate=115200, timeout=0.5) as ser:
-                ser.write(b"\r\n\r\n")  # Wake up command
-                time.sleep(1)
-                ser.write(b"$$\n")  # Request settings (common CNC command)
-                response = ser.read_all().decode()
-
-                if 'ok' in response.lower() or 'grbl' in response.lower():
-                    print(f"CNC detected on port: {port.device}")
-                    return port.device
-        except Exception as e:
-            continue
-
-    raise Exception("Could not automatically detect CNC port. Please check connections.")
-
-
-class CNC_Simulator:
-    def __init__(self, config):
-        sim_config = config['simulator']
-        self.MIN_X = sim_config['min_x']
-        self.MAX_X = sim_config['max_x']
-        self.MIN_Y = sim_config['min_y']
-        self.MAX_Y = sim_config['max_y']
-        self.figure_size = sim_config['figure_size']
-        plt.figure(figsize=self.figure_size)
-        plt.xlim((self.MIN_X, self.MAX_X))
-        plt.ylim((self.MIN_Y, self.MAX_Y))
-        self.current_x = 0
-        self.current_y = 0
-        self.MARKER_UP = True
-
-    def move_to_point(self, X, Y):
-        if self.MIN_X <= X <= self.MAX_X and self.MIN_Y <= Y <= self.MAX_Y:
-            if not self.MARKER_UP:
-                plt.plot([self.current_x, X], [self.current_y, Y], 'bo', linestyle="--")
-            self.current_x = X
-            self.current_y = Y
-        else:
-            print("Point out of bounds")
-
-    def move_down(self):
-        self.MARKER_UP = False
-
-    def move_up(self):
-        self.MARKER_UP = True
-
-    def render_drawing(self):
-        plt.show()
+    adapters = [port for port in ports if _is_cnc_adapter(port)]
+    if len(adapters) == 1:
+        print(f"CNC detected on port: {adapters[0].device}")
+        return adapters[0].device
+
+    # Reuse the last probe result while the same set of ports is attached
+    key = frozenset((port.device, port.vid, port.pid, port.serial_number) for port in ports)
+    if key in _PROBED_PORT:
+        print(f"CNC detected on port: {_PROBED_PORT[key]} (cached)")
+        return _PROBED_PORT[key]
+
+    # Probe all candidates in parallel. A known adapter that answers wins at
+    # once; any other port only if none of the adapters answer
+    executor = ThreadPoolExecutor(max_workers=len(ports))
+    futures = {executor.submit(_probe_port, port): port for port in ports}
+    adapters_left = len(adapters)
+    found = None
+    try:
+        for future in as_completed(futures):
+            port = futures[future]
+            is_adapter = port in adapters
+            adapters_left -= is_adapter
+            if future.result():
+                if is_adapter:
+                    found = port
+                    break
+                if found is None:
+                    found = port
+            if found is not None and adapters_left == 0:
+                break
+    finally:
+        executor.shutdown(wait=False)  # Don't wait out the slower probes
+
+    if found is None:
+        raise Exception("Could not automatically detect CNC port. Please check connections.")
+    print(f"CNC detected on port: {found.device}")
+    _PROBED_PORT.clear()
+    _PROBED_PORT[key] = found.device
+    return found.device
+
+
+def _probe_port(port):
+    """Whether a GRBL controller answers on this port (banner or 'ok')"""
+    # Ports that are busy or vanish mid-probe are simply skipped
+    with contextlib.suppress(serial.SerialException, OSError):
+        with serial.Serial(port.device, baudrate=115200, timeout=0.2) as ser:
+            _set_low_latency(ser)
+            ser.write(b"\r\n\r\n")  # Wake up command
+            # Returns on the first reply rather than sleeping a fixed second
+            for _ in range(10):
+                line = ser.readline().lower()
+                if b'grbl' in line or line.startswith(b'ok'):
+                    return True
+    return False
+
+
+def __getattr__(name):
+    # CNC_Simulator lives in cnc_simulator so controller-only scripts don't
+    # pay for importing matplotlib; still importable from here (PEP 562)
+    if name == 'CNC_Simulator':
+        from .cnc_simulator import CNC_Simulator
+        return CNC_Simulator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CNC_Controller:
@@ -98,92 +253,467 @@ class CNC_Controller:
         self.Z_HIGH_BOUND = ctrl_config['z_high_bound']
         self.X_OFFSET = ctrl_config['x_offset']
         self.Y_OFFSET = ctrl_config['y_offset']
-        self.gcode = ""
+        # Optional: CPU core for the serial reader thread (e.g. one kept free
+        # with isolcpus), so status replies aren't delayed by other work
+        self.READER_CPU = ctrl_config.get('reader_cpu')
+        self._gcode = bytearray()
+        self._position = None  # (monotonic time, coords) of the last status read
+        self._unacked = deque()  # Byte lengths of lines execute_async() left unacknowledged
+
+        # One connection for the controller's lifetime: every open would cost
+        # a wake-up handshake (and, on some boards, a reset that loses homing)
+        self.ser = self._open_port(timeout=0.1)
+        self.wake_up(self.ser)
+        self._start_reader()
+
+    @property
+    def gcode(self):
+        """Queued G-code as text (kept in a bytearray so appends stay O(1))"""
+        return self._gcode.decode('ascii')
+
+    @gcode.setter
+    def gcode(self, text):
+        self._gcode = bytearray(text.encode('ascii'))
+
+    def _open_port(self, timeout=None):
+        """Open the CNC serial port without resetting the board.
+
+        DTR is held low through the open: on Arduino-style GRBL boards a DTR
+        edge resets the controller, costing a ~2 s bootloader wait and the
+        homed state on every call. The adapter latency timer is lowered too.
+        """
+        ser = serial.Serial(baudrate=self.BAUD_RATE, timeout=timeout, dsrdtr=False, rtscts=False)
+        ser.port = self.SERIAL_PORT_PATH
+        ser.dtr = False
+        ser.open()
+        _set_low_latency(ser)
+        return ser
+
+    @contextlib.contextmanager
+    def _session(self):
+        """Use the persistent connection, reopening it if it was closed"""
+        if not self.ser.is_open:
+            self.ser.open()
+            self.wake_up(self.ser)
+            self._start_reader()
+            self._unacked.clear()  # Acks owed on the old connection will never come
+        # Collect acks execute_async() did not wait for, so character counting
+        # starts from an empty receive buffer and they aren't taken as ours
+        try:
+            while self._unacked:
+                self._unacked.popleft()
+                response = self._read_ack(self.ser)
+                if response.startswith('error'):
+                    print(f"GRBL rejected a line sent by execute_async(): {response}")
+        except (RuntimeError, TimeoutError):
+            self._unacked.clear()  # An alarm flushed GRBL's buffer; nothing more is owed
+            raise
+        # Drop replies nobody waited for so they can't be taken as acks
+        while not self._responses.empty():
+            self._responses.get_nowait()
+        yield self.ser
+
+    def _start_reader(self):
+        """Start the background thread that drains the port"""
+        self._responses = queue.Queue()
+        self._status = b''  # Latest '<...>' status report
+        self._status_seq = 0  # Bumped for every status report received
+        self._status_changed = threading.Condition()  # Notified on each report
+        self._reader = threading.Thread(target=self._read_loop, name="grbl-reader", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        """Read lines until the port closes.
+
+        Status reports replace the latest-status slot; every other line ('ok',
+        'error:N', messages) is queued for whichever command is waiting on it.
+        Nothing has to sleep-and-check the port any more.
+        """
+        if self.READER_CPU is not None and hasattr(os, 'sched_setaffinity'):
+            # pid 0 is the calling thread, so only the reader is pinned
+            try:
+                os.sched_setaffinity(0, {self.READER_CPU})
+            except OSError as e:
+                print(f"Could not pin the serial reader to CPU {self.READER_CPU}: {e}")
+        ser = self.ser
+        while ser.is_open:
+            try:
+                line = ser.readline().strip()
+            except (serial.SerialException, OSError, TypeError):
+                return  # Port closed while reading
+            if not line:
+                continue
+            if line.startswith(b'<'):
+                with self._status_changed:
+                    self._status = line
+                    self._status_seq += 1
+                    self._status_changed.notify_all()
+            else:
+                self._responses.put(line)
+
+    def _request_status(self, ser, timeout=0.2):
+        """Send '?' and return the next status report, or b'' on timeout.
+
+        Sleeps on a condition the reader thread notifies, so it wakes as soon
+        as the report arrives rather than on the next poll.
+        """
+        with self._status_changed:
+            seq = self._status_seq
+            ser.write(STATUS_QUERY)
+            if not self._status_changed.wait_for(lambda: self._status_seq != seq, timeout):
+                return b''
+            return self._status
+
+    def close(self):
+        """Close the serial connection (reopened automatically on next use)"""
+        self.ser.close()
+        self._reader.join(timeout=1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def home_xyz(self):
         """Home all axes using machine's homing cycle"""
-        with serial.Serial(self.SERIAL_PORT_PATH, self.BAUD_RATE) as ser:
-            self.wake_up(ser)
+        self._position = None  # Motion makes any cached position stale
+        with self._session() as ser:
             # Send homing command (Grbl-specific: $H)
             ser.write(b"$H\n")
             self.wait_for_movement_completion(ser, "$H")
+            self._read_ack(ser)  # GRBL acknowledges $H once the cycle ends
             print("Homing completed")
 
+    def _read_status(self, attempts=3):
+        """Send '?' and return the raw status report bytes (b'' if none came)"""
+        with self._session() as ser:
+            # Returns as soon as the status line arrives, 0.2 s per attempt at
+            # worst; a '?' sent while GRBL is still printing its banner is lost
+            for _ in range(attempts):
+                status = self._request_status(ser)
+                if status:
+                    return status
+            return b''
+
+    def query_status(self):
+        """Return GRBL's raw status report, e.g. '<Idle|MPos:0.000,0.000,0.000|FS:0,0>'"""
+        return self._read_status().decode('utf-8', 'ignore').strip()
+
     def read_coordinates(self):
-        """Read current machine coordinates"""
-        with serial.Serial(self.SERIAL_PORT_PATH, self.BAUD_RATE) as ser:
-            self.wake_up(ser)
-            ser.reset_input_buffer()
-            ser.write(b"?\n")
-            time.sleep(0.1)  # Wait for response
-            response = ser.readline().decode().strip()
-
-            # Parse position from response (format: <...|MPos:x,y,z|...>)
-            if 'MPos:' in response:
-                mpos_start = response.find('MPos:') + 5
-                mpos_end = response.find('|', mpos_start)
-                coordinates = list(map(float, response[mpos_start:mpos_end].split(',')))
-                return {'X': coordinates[0], 'Y': coordinates[1], 'Z': coordinates[2]}
-            return None
-
-    def wait_for_movement_completion(self, ser, cleaned_line):
-        Event().wait(1)
-        if cleaned_line != '$X' or '$$':
-            idle_counter = 0
-            while True:
-                ser.reset_input_buffer()
-                command = str.encode('?' + '\n')
-                ser.write(command)
-                grbl_out = ser.readline()
-                grbl_response = grbl_out.strip().decode('utf-8')
-                if grbl_response != 'ok':
-                    if 'Idle' in grbl_response:
-                        idle_counter += 1
-                if idle_counter > 0:
-                    break
-        return
+        """Read current machine coordinates.
+
+        Reads within POSITION_CACHE_TTL of the previous one (and with no motion
+        command in between) reuse its result instead of another serial query.
+        """
+        if self._position and time.monotonic() - self._position[0] < POSITION_CACHE_TTL:
+            return dict(self._position[1])
+        match = _MPOS_RE.search(self._read_status())
+        if match:
+            x, y, z = map(float, match.groups())
+            coords = {'X': x, 'Y': y, 'Z': z}
+            self._position = (time.monotonic(), coords)
+            return dict(coords)
+        return None
+
+    def wait_for_movement_completion(self, ser, cleaned_line, grace=0.25, timeout=30,
+                                     poll_interval=0.02):
+        """Block until GRBL is Idle after cleaned_line was sent.
+
+        Instead of sleeping a fixed second before polling, Idle is accepted as
+        soon as the machine has been seen moving, or once the short grace
+        period has passed for commands that cause no motion.
+
+        Returns True once Idle. Returns False once GRBL has spent timeout
+        seconds in total either silent (e.g. the port was unplugged) or in a
+        state that is not moving, such as Hold or Door; time spent in Run
+        does not count, so long moves never hit the timeout. Raises
+        RuntimeError if GRBL reports an alarm, since it will never get back
+        to Idle on its own.
+        """
+        if not _has_motion(cleaned_line):
+            return True  # Settings, queries, $X etc. are done once acknowledged
+        started = previous = time.monotonic()
+        stalled = 0.0
+        moved = False
+        while True:
+            grbl_response = self._request_status(ser)
+            now = time.monotonic()
+            _check_alarm(grbl_response)
+            state = _status_state(grbl_response)
+            if state == 'Idle':
+                if moved or now - started >= grace:
+                    return True
+            elif state in _MOVING_STATES:
+                moved = True
+            else:
+                stalled += now - previous
+                if stalled >= timeout:
+                    reason = f"in {state}" if state else "without a status report"
+                    print(f"GRBL spent {timeout}s {reason}, giving up on waiting for Idle")
+                    return False
+            previous = now
+            if grbl_response:
+                time.sleep(poll_interval)  # A missing reply already waited in _request_status
+
+    def wait_until_idle(self, poll_interval=0.02, timeout=30):
+        """Poll GRBL status reports until the machine reports Idle.
+
+        Returns True as soon as Idle is reported, False if the timeout expires first.
+        """
+        with self._session() as ser:
+            return self._wait_for_state(ser, 'Idle', poll_interval, timeout)
+
+    def _wait_for_state(self, ser, target, poll_interval=0.02, timeout=None):
+        """Poll '?' on an open port until the reported state is target (e.g. 'Idle', 'Hold')"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            response = self._request_status(ser).decode()
+            # Status report format: <State|MPos:x,y,z|...>, Hold reports as Hold:0
+            if response:
+                state = response[1:].split('|', 1)[0].split(':', 1)[0]
+                if state == target:
+                    return True
+            time.sleep(poll_interval)
+        return False
 
     def move_down(self):
-        self.gcode += "G0 Z-33.5\n"
+        self._gcode += b"G0 Z-33.5\n"
 
     def move_up(self):
-        self.gcode += "G0 Z0\n"
+        self._gcode += b"G0 Z0\n"
 
     def move_to_height(self, z):
-        self.gcode += f"G0 Z{z}\n"
+        self._gcode += _G0_Z_FMT % z
 
     def move_to_point(self, x, y):
-        if self.coordinates_within_bounds(x, y):
-            self.gcode += f"G0 X{x + self.X_OFFSET} Y{y + self.Y_OFFSET}\n"
+        # Same check as coordinates_within_bounds, inlined: runs once per waypoint
+        if self.X_LOW_BOUND <= x <= self.X_HIGH_BOUND and self.Y_LOW_BOUND <= y <= self.Y_HIGH_BOUND:
+            self._gcode += _G0_XY_FMT % (x + self.X_OFFSET, y + self.Y_OFFSET)
         else:
             print(f"Cannot move to {x}, {y}, coordinates not within bounds")
 
+    def move_to_points(self, points):
+        """Queue a G0 move to each (x, y) pair in order, e.g. get_well_dict(...).values().
+
+        Same bounds check and offsets as move_to_point, with the limits held in
+        locals and the G-code joined into one append; out-of-bounds points are
+        reported and skipped.
+        """
+        x_low, x_high = self.X_LOW_BOUND, self.X_HIGH_BOUND
+        y_low, y_high = self.Y_LOW_BOUND, self.Y_HIGH_BOUND
+        x_offset, y_offset = self.X_OFFSET, self.Y_OFFSET
+        lines = []
+        for x, y in points:
+            if x_low <= x <= x_high and y_low <= y <= y_high:
+                lines.append(_G0_XY_FMT % (x + x_offset, y + y_offset))
+            else:
+                print(f"Cannot move to {x}, {y}, coordinates not within bounds")
+        self._gcode += b"".join(lines)
+
     def coordinates_within_bounds(self, x, y):
         return (
             self.X_LOW_BOUND <= x <= self.X_HIGH_BOUND and
             self.Y_LOW_BOUND <= y <= self.Y_HIGH_BOUND
         )
 
-    def wake_up(self, ser):
-        ser.write(str.encode("\r\n\r\n"))
-        time.sleep(1)
+    def wake_up(self, ser, timeout=1):
+        """Wake GRBL and wait for its reply instead of sleeping a fixed second.
+
+        GRBL answers the blank lines with 'ok', or prints its
+        "Grbl 1.1h ['$' for help]" banner if opening the port reset the board.
+        Once a reply has been seen, reading stops at the first quiet gap.
+        """
+        ser.write(WAKE_UP)
+        previous_timeout = ser.timeout
+        ser.timeout = 0.05
+        deadline = time.monotonic() + timeout
+        try:
+            answered = False
+            while time.monotonic() < deadline:
+                line = ser.readline()
+                if not line and answered:
+                    break
+                if line.startswith(b'ok') or b'Grbl' in line:
+                    answered = True
+        finally:
+            ser.timeout = previous_timeout
         ser.flushInput()
         print("CNC machine is active")
 
-    def execute_movement(self, buffer=20):
-        """Execute accumulated G-code movements on the CNC machine"""
-        with serial.Serial(self.SERIAL_PORT_PATH, self.BAUD_RATE) as ser:
-            self.wake_up(ser)
+    def queue_gcode(self, lines):
+        """Append raw G-code lines (without newlines) to the movement buffer"""
+        for line in lines:
+            self._gcode += f"{line}\n".encode('ascii')
+
+    def execute_async(self):
+        """Stream the buffered G-code without waiting for the acks or the moves.
+
+        Returns as soon as the last line has been written. Only a program
+        longer than GRBL's 128-byte receive buffer waits, for the acks that
+        make room. Returns the responses received so far. The acks for the
+        last lines written are collected at the start of the next command,
+        and any 'error:N' among them is printed. The machine may still be
+        moving (see wait_until_idle()).
+        """
+        self._position = None
+        with self._session() as ser:
+            out_strings = self._stream(ser, self._gcode.split(b'\n'), drain=False)
+        self._gcode.clear()
+        return out_strings
+
+    def stream_gcode(self, lines, on_pause=None):
+        """Stream a complete G-code program using character counting.
+
+        A line with an M0 word (also 'M00' or 'M0 ; dispense') pauses the
+        program: once GRBL reports Hold, on_pause() is called (default: wait
+        for Enter) and a cycle start '~' resumes it. This lets a whole plate
+        run (move, descend, M0 for dispense, lift, ...) go out in one serial
+        session. M1/M01 lines are sent the same way, but GRBL acknowledges
+        them without pausing, so on_pause() is not called for them.
+
+        Returns:
+            GRBL's responses, one per line sent
+
+        Raises RuntimeError if GRBL reports an alarm, and TimeoutError if it
+        neither pauses nor answers (see _wait_for_pause()).
+        """
+        if on_pause is None:
+            on_pause = lambda: input("Program paused (M0). Press Enter to resume...")
+        self._position = None
+        with self._session() as ser:
             out_strings = []
-            commands = self.gcode.split('\n')
-            for i in range(math.ceil(len(commands) / buffer)):
-                buffered_commands = commands[i*buffer:(i+1)*buffer]
-                buffered_gcode = "\n".join(buffered_commands) + "\n"
-                ser.write(str.encode(buffered_gcode))
-                self.wait_for_movement_completion(ser, buffered_gcode)
-                grbl_out = ser.readline()
-                out_strings.append(grbl_out.strip().decode('utf-8'))
-            self.gcode = ""  # Clear the gcode buffer after execution
+            segment = []
+            for line in lines:
+                if not _is_pause(line):
+                    segment.append(line)
+                    continue
+                out_strings += self._stream(ser, segment)
+                segment = []
+                if isinstance(line, str):
+                    line = line.encode('ascii')
+                ser.write(line.strip() + b"\n")
+                ack = self._wait_for_pause(ser)
+                if ack is None:
+                    on_pause()
+                    ser.write(b"~")
+                    ack = self._read_ack(ser)  # GRBL acknowledges M0 once resumed
+                out_strings.append(ack)
+            out_strings += self._stream(ser, segment)
+        return out_strings
+
+    def _wait_for_pause(self, ser, timeout=30, poll_interval=0.02):
+        """Wait for GRBL to hold at a program pause line that was just sent.
+
+        GRBL finishes the moves before the pause first, so time spent in Run
+        does not count toward timeout; time spent silent or in another state
+        does. Returns None once GRBL reports Hold, or the acknowledgement if
+        it answered the line without pausing ('ok' for M1 or in check mode,
+        'error:N' if the line was rejected). Raises RuntimeError on an alarm
+        and TimeoutError once timeout is used up.
+        """
+        previous = time.monotonic()
+        stalled = 0.0
+        while True:
+            try:
+                response = self._responses.get_nowait().decode('utf-8', 'ignore')
+                if response == 'ok' or response.startswith('error'):
+                    return response
+                continue
+            except queue.Empty:
+                pass
+            report = self._request_status(ser)
+            now = time.monotonic()
+            _check_alarm(report)
+            state = _status_state(report)
+            if state == 'Hold':
+                return None
+            if state not in _MOVING_STATES:
+                stalled += now - previous
+                if stalled >= timeout:
+                    raise TimeoutError(f"GRBL on {self.SERIAL_PORT_PATH} did not pause within "
+                                       f"{timeout}s (last state: {state or 'no response'})")
+            previous = now
+            if report:
+                time.sleep(poll_interval)
+
+    def _stream(self, ser, lines, drain=True):
+        """Send lines using GRBL's character-counting protocol.
+
+        A new line is sent as soon as it fits in the 128-byte receive buffer,
+        so GRBL always has the next command queued instead of waiting for a
+        send-and-wait round-trip per line. Lines that fit together are
+        coalesced into a single write. With drain=False, returns right after
+        the last write and leaves the outstanding acks to the next _session().
+        """
+        pending = deque()  # byte lengths of lines not yet acknowledged
+        buffered = 0
+        chunk = bytearray()  # lines that fit but are not written yet
+        out_strings = []
+        for line in lines:
+            if isinstance(line, str):
+                line = line.encode('ascii')
+            line = line.strip()
+            if not line:
+                continue
+            data = line + b"\n"
+            while pending and buffered + len(data) > RX_BUFFER_SIZE:
+                if chunk:
+                    ser.write(chunk)
+                    chunk.clear()
+                out_strings.append(self._read_ack(ser))
+                buffered -= pending.popleft()
+            chunk += data
+            pending.append(len(data))
+            buffered += len(data)
+        if chunk:
+            ser.write(chunk)
+        if not drain:
+            self._unacked = pending
+            return out_strings
+        while pending:
+            out_strings.append(self._read_ack(ser))
+            pending.popleft()
+        return out_strings
+
+    def _read_ack(self, ser, timeout=30):
+        """Wait for the reader thread to receive GRBL's 'ok' or 'error:N'.
+
+        An ack can legitimately take as long as a move while GRBL's planner is
+        full, so instead of timing the ack itself, GRBL is polled with '?'
+        while waiting. Raises RuntimeError if it reports an alarm (which
+        flushes its buffer, so the ack never comes) and TimeoutError if it
+        stops answering altogether for timeout seconds.
+        """
+        last_reply = time.monotonic()
+        while True:
+            try:
+                response = self._responses.get(timeout=0.5).decode('utf-8', 'ignore')
+            except queue.Empty:
+                status = self._request_status(ser)
+                now = time.monotonic()
+                _check_alarm(status)
+                if status:
+                    last_reply = now
+                elif now - last_reply >= timeout or not self._reader.is_alive():
+                    raise TimeoutError(f"No response from GRBL on {self.SERIAL_PORT_PATH} "
+                                       f"for {timeout}s; check the connection")
+                continue
+            if response == 'ok' or response.startswith('error'):
+                return response
+
+    def execute_movement(self, buffer=20):
+        """Execute accumulated G-code movements on the CNC machine.
+
+        The whole buffer is streamed with character counting, so GRBL can plan
+        consecutive moves back to back; returns GRBL's responses once the
+        machine is Idle again. buffer is kept for compatibility and unused.
+        """
+        self._position = None
+        with self._session() as ser:
+            out_strings = self._stream(ser, self._gcode.split(b'\n'))
+            self.wait_for_movement_completion(ser, self.gcode)
+            self._gcode.clear()  # Clear the gcode buffer after execution
             return out_strings
 
 if __name__ == "__main__":
@@ -209,16 +739,12 @@ if __name__ == "__main__":
 
         # loading_position = (-140.0, 120.0, -38.0)
 
-        # # Moving tool to a point on xy
-        # xy = (loading_position[0], loading_position[1])
+        # # Queue the XY and Z moves together and send them as one program,
+        # # so GRBL plans both without an extra serial round-trip in between
         # controller.move_to_point(loading_position[0], loading_position[1])
-        # controller.render_drawing()
-        # print(f"Moved (X,Y) to {xy}")
-
-        # # Moving tool to a point on z
         # controller.move_to_height(loading_position[2])
-        # controller.render_drawing()
-        # print(f"Moved Z to {loading_position[2]}")
+        # controller.execute_movement()
+        # print(f"Moved to {loading_position}")
 
         # # Read machine internal coordinates
         # coord = controller.read_coordinates()
@@ -0,0 +1,57 @@
+"""
+CNC Simulator
+Plots the pen-down path of a drawing with matplotlib, without hardware.
+
+Kept apart from cnc_controller so that driving the real machine doesn't
+import matplotlib.
+"""
+
+import matplotlib.pyplot as plt
+
+
+class CNC_Simulator:
+    def __init__(self, config):
+        sim_config = config['simulator']
+        self.MIN_X = sim_config['min_x']
+        self.MAX_X = sim_config['max_x']
+        self.MIN_Y = sim_config['min_y']
+        self.MAX_Y = sim_config['max_y']
+        self.figure_size = sim_config['figure_size']
+        self.current_x = 0
+        self.current_y = 0
+        self.MARKER_UP = True
+        # Pen-down path, drawn in one plot call by render_drawing();
+        # separate strokes are split by NaN points, which matplotlib skips
+        self._path_x = []
+        self._path_y = []
+
+    def move_to_point(self, X, Y):
+        if self.MIN_X <= X <= self.MAX_X and self.MIN_Y <= Y <= self.MAX_Y:
+            if not self.MARKER_UP:
+                if not self._path_x or (self._path_x[-1], self._path_y[-1]) != (self.current_x, self.current_y):
+                    # New stroke: break from the previous one, then start here
+                    if self._path_x:
+                        self._path_x.append(float('nan'))
+                        self._path_y.append(float('nan'))
+                    self._path_x.append(self.current_x)
+                    self._path_y.append(self.current_y)
+                self._path_x.append(X)
+                self._path_y.append(Y)
+            self.current_x = X
+            self.current_y = Y
+        else:
+            print("Point out of bounds")
+
+    def move_down(self):
+        self.MARKER_UP = False
+
+    def move_up(self):
+        self.MARKER_UP = True
+
+    def render_drawing(self):
+        plt.figure(figsize=self.figure_size)
+        plt.xlim((self.MIN_X, self.MAX_X))
+        plt.ylim((self.MIN_Y, self.MAX_Y))
+        if self._path_x:
+            plt.plot(self._path_x, self._path_y, 'bo', linestyle="--")
+        plt.show()
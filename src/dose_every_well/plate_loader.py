@@ -41,21 +41,23 @@ Example:
     loader.set_plate_type('custom_384_well')
 """
 
+import contextlib
+from collections import deque
+import copy
+import functools
+import json
+import os
 import time
 import logging
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from pathlib import Path
 import yaml
 
+# libyaml's C loader when PyYAML was built with it (pip wheels usually are)
 try:
-    from adafruit_pca9685 import PCA9685
-    import board
-    import busio
-    from adafruit_motor import servo
-except ImportError as e:
-    print("Required libraries not installed. On Raspberry Pi, run:")
-    print("  pip install adafruit-circuitpython-pca9685 adafruit-circuitpython-motor")
-    raise e
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 # Configure logging
@@ -65,6 +67,84 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Servo positions saved by a clean shutdown, so the next start can skip the
+# initialization sweep (see calibrate_on_start)
+STATE_PATH = Path.home() / ".cache" / "dose_every_well" / "plate_state.json"
+
+# Device tree clock of the Pi's GPIO 2/3 I2C bus (big-endian u32, in Hz)
+I2C_CLOCK_PATH = Path("/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML config file once per (path, mtime, size).
+    
+    The parsed dict is also kept in a JSON sidecar next to the YAML file
+    (plate_settings.cache.json), which is much faster to load than YAML in
+    a fresh process. The YAML file stays the source of truth: the sidecar is
+    only used when it was written for the exact same mtime and size.
+    """
+    sidecar = Path(config_path).with_suffix('.cache.json')
+    with contextlib.suppress(OSError, ValueError, KeyError):
+        with open(sidecar, 'r') as f:
+            cached = json.load(f)
+        if cached['source_mtime_ns'] == mtime_ns and cached['source_size'] == size:
+            return cached['config']
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f.read(), Loader=_YamlLoader)
+    
+    # Best effort: the package directory may be read-only
+    tmp_path = sidecar.with_suffix('.tmp')
+    with contextlib.suppress(OSError, TypeError, ValueError):
+        with open(tmp_path, 'w') as f:
+            json.dump({'source_mtime_ns': mtime_ns, 'source_size': size, 'config': config}, f)
+        os.replace(tmp_path, sidecar)
+    return config
+
+
+def _check_i2c_bus_speed(minimum: int = 400000):
+    """
+    Warn if the I2C bus runs below minimum Hz. The Pi defaults to 100 kHz,
+    which makes every smooth-move step wait on the bus; the clock is set in
+    /boot/firmware/config.txt with dtparam=i2c_arm=on,i2c_arm_baudrate=400000
+    (the PCA9685 also supports 1000000).
+    """
+    try:
+        clock = int.from_bytes(I2C_CLOCK_PATH.read_bytes()[:4], 'big')
+    except OSError:
+        return  # Not a Pi, or the bus has no device tree node
+    if clock < minimum:
+        logger.warning(f"I2C bus clock is {clock // 1000} kHz; set i2c_arm_baudrate={minimum} "
+                       f"in /boot/firmware/config.txt for faster servo updates")
+
+
+def _sleep_until(deadline: float):
+    """
+    Sleep until time.perf_counter() reaches deadline. time.sleep can overshoot
+    by a few ms on Linux, so the last millisecond is spun instead.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
+@functools.lru_cache(maxsize=64)
+def _trajectory(current: float, target: float, speed: float) -> tuple:
+    """
+    Waypoints from current to target in steps of speed degrees, ending exactly
+    on target. Cached, since raise/lower/open/close repeat the same few moves.
+    """
+    step = speed if target > current else -speed
+    steps = abs(int((target - current) / speed))
+    waypoints = [current + step * i for i in range(steps + 1)]
+    if waypoints[-1] != target:
+        waypoints.append(target)  # Ensure we reach exact target
+    return tuple(waypoints)
+
 
 class PlateLoader:
     """
@@ -98,14 +178,18 @@ class PlateLoader:
                 "Please ensure plate_settings.yaml exists in the module directory."
             )
         
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Keyed on mtime and size so edits to the YAML file are still picked up;
+        # callers get their own copy since reload_config replaces dict entries
+        stat = config_path.stat()
+        config = _parse_config(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
         
         logger.info(f"Loaded configuration from: {config_path}")
-        return config
+        return copy.deepcopy(config)
     
     def __init__(self, plate_type: str, i2c_address: Optional[int] = None, 
-                 frequency: Optional[int] = None, config_path: Optional[Path] = None):
+                 frequency: Optional[int] = None, config_path: Optional[Path] = None,
+                 calibrate_on_start: bool = True,
+                 weight_provider: Optional[Callable[[], float]] = None, i2c=None):
         """
         Initialize the plate loader controller.
         
@@ -115,6 +199,13 @@ class PlateLoader:
             i2c_address: I2C address of PCA9685 (default from config file)
             frequency: PWM frequency in Hz (default from config file)
             config_path: Path to configuration file (default: plate_settings.yaml in module directory)
+            calibrate_on_start: If False and the last run shut down cleanly, restore the
+                               saved positions instead of running the initialization sweep
+            weight_provider: Optional callable returning the current load cell reading in
+                            grams. When given, load/unload sequences continue as soon as
+                            the plate change is detected instead of waiting for Enter
+            i2c: Existing busio.I2C bus to use, e.g. one shared with a SolidDoser
+                 (default: open a new one, closed again by shutdown())
         
         Raises:
             ValueError: If plate_type is not found in plate_settings.yaml
@@ -138,6 +229,11 @@ class PlateLoader:
         movement = self.config['movement']
         self.DEFAULT_MOVE_SPEED = movement['default_move_speed']
         self.DEFAULT_MOVE_DELAY = movement['default_move_delay']
+        # Optional in older settings files; 0 leaves speeds as given
+        self.MIN_STEP_DEG = movement.get('min_step_deg', 0)
+        # Load cell change that counts as a plate inserted/removed (weight_provider only)
+        self.PLATE_DETECT_GRAMS = movement.get('plate_detect_grams', 5.0)
+        self.PLATE_DETECT_TIMEOUT = movement.get('plate_detect_timeout', 120.0)
         
         self.PLATE_TYPES = self.config['plate_types']
         
@@ -158,16 +254,30 @@ class PlateLoader:
         
         self.plate_type = plate_type
         plate_config = self.PLATE_TYPES[plate_type]
-        self.plate_safe_angle = plate_config['plate_safe_angle']
-        self.lid_safe_angle = plate_config['lid_safe_angle']
+        self._apply_safe_angles(plate_config)
+        self.weight_provider = weight_provider
         
         logger.info("Initializing Plate Loader...")
         logger.info(f"Plate type: {plate_type} - {plate_config['description']}")
         if self.plate_safe_angle is not None:
             logger.info(f"  Safety limits: Plate >= {self.plate_safe_angle}° when Lid > {self.lid_safe_angle}°")
         
-        # Initialize I2C bus
-        self.i2c = busio.I2C(board.SCL, board.SDA)
+        # Hardware libraries are imported here rather than at module level, so
+        # config parsing and collision info work without the Pi stack
+        try:
+            from adafruit_pca9685 import PCA9685
+            import board
+            import busio
+        except ImportError as e:
+            raise ImportError(
+                "Required libraries not installed. On Raspberry Pi, run:\n"
+                "  pip install adafruit-circuitpython-pca9685"
+            ) from e
+        
+        # Initialize I2C bus, unless the caller shares theirs
+        self._owns_i2c = i2c is None
+        self.i2c = busio.I2C(board.SCL, board.SDA) if i2c is None else i2c
+        _check_i2c_bus_speed()
         
         # Initialize PCA9685
         self.pca = PCA9685(self.i2c, address=i2c_address)
@@ -178,65 +288,218 @@ class PlateLoader:
         min_pulse = pulse_config['min_pulse']
         max_pulse = pulse_config['max_pulse']
         
-        # Initialize servos (using standard 0-180° range, we translate in software)
-        self.plate_lift_1 = servo.Servo(
-            self.pca.channels[self.PLATE_LIFT_1],
-            min_pulse=min_pulse,
-            max_pulse=max_pulse
-        )
-        
-        self.plate_lift_2 = servo.Servo(
-            self.pca.channels[self.PLATE_LIFT_2],
-            min_pulse=min_pulse,
-            max_pulse=max_pulse
-        )
-        
-        self.lid_servo = servo.Servo(
-            self.pca.channels[self.LID_SERVO],
-            min_pulse=min_pulse,
-            max_pulse=max_pulse
-        )
-        
-        # Initialization sequence
-        logger.info("Starting initialization sequence...")
-        
-        # Step 1: Retract plate to down position
-        logger.info("Step 1: Retracting plate to down position...")
-        self._plate_position = self.PLATE_DOWN_ANGLE
-        self._set_plate_servos(self.PLATE_DOWN_ANGLE)  # Move to 90° (down)
-        time.sleep(1)
-        
-        # Step 2: Open lid
-        logger.info(f"Step 2: Opening lid to {self.LID_OPEN_ANGLE}°...")
-        self.lid_servo.angle = self.LID_OPEN_ANGLE  # Open to 30°
-        self._lid_position = self.LID_OPEN_ANGLE
-        time.sleep(2)
+        # Servos use the standard 0-180° range (we translate in software) and
+        # are written as raw LEDn register frames, with the same mapping as
+        # adafruit_motor's servo.Servo. Frames are cached per angle since smooth
+        # moves revisit the same waypoints every time.
+        pwm_frequency = self.pca.frequency
+        self._min_duty = int(min_pulse * pwm_frequency / 1000000 * 0xFFFF)
+        self._duty_range = int(max_pulse * pwm_frequency / 1000000 * 0xFFFF) - self._min_duty
+        self._plate_frames = {}
+        self._lid_frames = {}
+        
+        # Servo pulses always start at count 0, so the LEDn_ON registers are
+        # zeroed once here and every later write only touches LEDn_OFF
+        with self.pca.i2c_device as i2c:
+            for channel in (self.PLATE_LIFT_1, self.PLATE_LIFT_2, self.LID_SERVO):
+                i2c.write(bytes((0x06 + 4 * channel, 0, 0)))
+        
+        # Last values written to the servos, so repeated commands skip the bus;
+        # None forces the next write (e.g. after the PWM output was released)
+        self._last_plate_frames = None
+        self._last_lid_angle = None
+        
+        # (position getter, collision check, setter) per axis for _move_axis
+        self._axes = {
+            'plate': (lambda: self._plate_position, self._check_plate_movement_safe, self._set_plate_servos),
+            'lid': (lambda: self._lid_position, self._check_lid_movement_safe, self._set_lid_servo),
+        }
         
-        # Step 3: Move plate to up position
-        logger.info(f"Step 3: Moving plate to up position ({self.PLATE_UP_ANGLE}°)...")
-        self._set_plate_servos(self.PLATE_UP_ANGLE)  # Move to -90° (up)
-        self._plate_position = self.PLATE_UP_ANGLE
+        # A saved state is only trusted once: loading it removes the file
+        saved_positions = self._load_state()
+        if saved_positions is not None and not calibrate_on_start:
+            self._plate_position, self._lid_position = saved_positions
+            logger.info(f"Restoring saved positions: Plate={self._plate_position}°, Lid={self._lid_position}°")
+            self._set_plate_servos(self._plate_position)
+            self._set_lid_servo(self._lid_position)
+        else:
+            # Initialization sequence
+            logger.info("Starting initialization sequence...")
+            
+            # Step 1: Retract plate to down position
+            logger.info("Step 1: Retracting plate to down position...")
+            self._plate_position = self.PLATE_DOWN_ANGLE
+            self._set_plate_servos(self.PLATE_DOWN_ANGLE)  # Move to 90° (down)
+            time.sleep(1)
+            
+            # Step 2: Open lid
+            logger.info(f"Step 2: Opening lid to {self.LID_OPEN_ANGLE}°...")
+            self._set_lid_servo(self.LID_OPEN_ANGLE)  # Open to 30°
+            time.sleep(2)
+            
+            # Step 3: Move plate to up position
+            logger.info(f"Step 3: Moving plate to up position ({self.PLATE_UP_ANGLE}°)...")
+            self._set_plate_servos(self.PLATE_UP_ANGLE)  # Move to -90° (up)
+            self._plate_position = self.PLATE_UP_ANGLE
         
         logger.info("Plate Loader initialized successfully")
         logger.info(f"  Plate lift servos: channels {self.PLATE_LIFT_1}, {self.PLATE_LIFT_2}")
-        logger.info(f"  Lid servo: channel {self.LID_SERVO} at {self.LID_OPEN_ANGLE}°")
+        logger.info(f"  Lid servo: channel {self.LID_SERVO} at {self._lid_position}°")
+    
+    def _load_state(self) -> Optional[Tuple[float, float]]:
+        """
+        Read and remove the positions saved by the last shutdown().
+        
+        Returns:
+            (plate_angle, lid_angle), or None if there is no usable saved state
+        """
+        try:
+            with open(STATE_PATH, 'r') as f:
+                state = json.load(f)
+            os.remove(STATE_PATH)
+        except (OSError, ValueError):
+            return None
+        
+        try:
+            plate, lid = float(state['plate_position']), float(state['lid_position'])
+            channels = state['channels']
+        except (KeyError, TypeError, ValueError):
+            return None
+        if channels != [self.PLATE_LIFT_1, self.PLATE_LIFT_2, self.LID_SERVO]:
+            return None
+        if not (self.PLATE_UP_ANGLE <= plate <= self.PLATE_DOWN_ANGLE
+                and self.LID_OPEN_ANGLE <= lid <= self.LID_CLOSED_ANGLE):
+            return None
+        if self._collision_enabled and plate < self.plate_safe_angle and lid > self.lid_safe_angle:
+            return None
+        return plate, lid
     
-    def _set_plate_servos(self, angle: float):
+    def _save_state(self):
+        """Save the current positions for the next start (best effort)."""
+        state = {
+            'plate_position': self._plate_position,
+            'lid_position': self._lid_position,
+            'channels': [self.PLATE_LIFT_1, self.PLATE_LIFT_2, self.LID_SERVO],
+        }
+        tmp_path = STATE_PATH.with_suffix('.tmp')
+        try:
+            STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, STATE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not save servo positions: {e}")
+    
+    def _set_plate_servos(self, angle: float, force: bool = False):
         """
         Set both plate lift servos to the same angle (synchronized movement).
         Motor 2 is mirrored to move in the same physical direction as Motor 1.
         
         Args:
             angle: Target angle in degrees (-90 to 90 logical range)
+            force: Write the registers even if this angle was the last one written
         """
         # Translate logical angle (-90 to 90) to servo angle (0 to 180)
         servo1_angle = angle + 90  # -90->0, 0->90, 90->180
         servo2_angle = 90 - angle  # -90->180, 0->90, 90->0 (mirrored)
         
-        self.plate_lift_1.angle = servo1_angle
-        self.plate_lift_2.angle = servo2_angle
+        frames = self._plate_frames.get(angle)
+        if frames is None:
+            frames = self._plate_frames[angle] = self._pwm_frames({
+                self.PLATE_LIFT_1: self._servo_angle_to_duty(servo1_angle),
+                self.PLATE_LIFT_2: self._servo_angle_to_duty(servo2_angle),
+            })
+        # All writes under one bus lock, back to back, to keep the pair in step
+        if force or frames is not self._last_plate_frames:
+            with self.pca.i2c_device as i2c:
+                for frame in frames:
+                    i2c.write(frame)
+            self._last_plate_frames = frames
         self._plate_position = angle
-        logger.debug(f"Plate servos set - Motor 1 (Ch3): {servo1_angle}° (logical: {angle}°), Motor 2 (Ch6): {servo2_angle}° (mirrored)")
+        # %-style so the message is only formatted when DEBUG is enabled; this
+        # runs on every smooth-move step
+        logger.debug("Plate servos set - Motor 1 (Ch%d): %s° (logical: %s°), Motor 2 (Ch%d): %s° (mirrored)",
+                     self.PLATE_LIFT_1, servo1_angle, angle, self.PLATE_LIFT_2, servo2_angle)
+    
+    def _servo_angle_to_duty(self, servo_angle: float) -> int:
+        """
+        Convert a servo angle (0-180°) to the 16-bit PCA9685 duty cycle.
+        
+        Raises:
+            ValueError: If the angle is outside 0-180°, as adafruit_motor's servo.Servo would
+        """
+        if not 0 <= servo_angle <= 180:
+            raise ValueError("Angle out of range")
+        return self._min_duty + int(servo_angle / 180 * self._duty_range)
+    
+    def _set_lid_servo(self, angle: float, force: bool = False):
+        """
+        Set the lid servo angle and track it as the lid position. A bound
+        method, so smooth moves don't build a new closure per call.
+        
+        Args:
+            angle: Target angle in degrees (0 to 180)
+            force: Write the registers even if this angle was the last one written
+        """
+        if force or angle != self._last_lid_angle:
+            frames = self._lid_frames.get(angle)
+            if frames is None:
+                frames = self._lid_frames[angle] = self._pwm_frames({
+                    self.LID_SERVO: self._servo_angle_to_duty(angle),
+                })
+            with self.pca.i2c_device as i2c:
+                for frame in frames:
+                    i2c.write(frame)
+            self._last_lid_angle = angle
+        self._lid_position = angle
+    
+    @staticmethod
+    def _off_registers(duty: int) -> bytes:
+        """
+        LEDn_OFF_L/H values for a 16-bit duty cycle, with the same conversion as
+        PCA9685 PWMChannel.duty_cycle. LEDn_ON is held at 0, so full on (0xFFFF)
+        is not representable; servo duty cycles never get near it.
+        """
+        off = (duty + 1) >> 4
+        return bytes((off & 0xFF, off >> 8))
+    
+    @classmethod
+    def _pwm_frames(cls, duties: dict) -> tuple:
+        """
+        Build the I2C writes that set several channels' duty cycles. Each write
+        starts at LEDn_OFF_L; runs of consecutive channels share one write,
+        relying on the PCA9685's register auto-increment (enabled when the
+        frequency is set) and rewriting the next channel's ON registers as 0.
+        
+        Args:
+            duties: Channel number -> 16-bit duty cycle
+            
+        Returns:
+            Tuple of byte strings, one per I2C write
+        """
+        frames = []
+        previous = None
+        for channel in sorted(duties):
+            if previous is not None and channel == previous + 1:
+                frames[-1] += b'\x00\x00' + cls._off_registers(duties[channel])
+            else:
+                frames.append(bytes((0x08 + 4 * channel,)) + cls._off_registers(duties[channel]))
+            previous = channel
+        return tuple(frames)
+    
+    def _apply_safe_angles(self, plate_config: dict):
+        """
+        Set the collision limits from a plate type entry. Checking is enabled
+        only when both angles are set, so the move checks are a flag test on
+        the disabled path.
+        
+        Args:
+            plate_config: Entry from plate_types in plate_settings.yaml
+        """
+        self.plate_safe_angle = plate_config['plate_safe_angle']
+        self.lid_safe_angle = plate_config['lid_safe_angle']
+        self._collision_enabled = self.plate_safe_angle is not None and self.lid_safe_angle is not None
+        self._collision_info = None
     
     def _check_plate_movement_safe(self, target_plate_angle: float) -> bool:
         """
@@ -248,12 +511,9 @@ class PlateLoader:
         Returns:
             True if movement is safe, False if collision would occur
         """
-        # Skip check if collision avoidance is disabled
-        if self.plate_safe_angle is None:
-            return True
-        
         # Rule: If lid > lid_safe_angle, plate must be >= plate_safe_angle
-        if self._lid_position > self.lid_safe_angle and target_plate_angle < self.plate_safe_angle:
+        if (self._collision_enabled and self._lid_position > self.lid_safe_angle
+                and target_plate_angle < self.plate_safe_angle):
             logger.warning(
                 f"COLLISION RISK: Cannot move plate to {target_plate_angle}° "
                 f"while lid is at {self._lid_position}°. "
@@ -274,12 +534,9 @@ class PlateLoader:
         Returns:
             True if movement is safe, False if collision would occur
         """
-        # Skip check if collision avoidance is disabled
-        if self.lid_safe_angle is None:
-            return True
-        
         # Rule: If plate < plate_safe_angle, lid must be <= lid_safe_angle
-        if self._plate_position < self.plate_safe_angle and target_lid_angle > self.lid_safe_angle:
+        if (self._collision_enabled and self._plate_position < self.plate_safe_angle
+                and target_lid_angle > self.lid_safe_angle):
             logger.warning(
                 f"COLLISION RISK: Cannot move lid to {target_lid_angle}° "
                 f"while plate is at {self._plate_position}°. "
@@ -302,28 +559,131 @@ class PlateLoader:
             speed: Movement speed in degrees per step
             delay: Delay between steps in seconds
         """
-        speed = speed or self.DEFAULT_MOVE_SPEED
+        # Steps finer than the servo can resolve only add I2C writes
+        speed = max(speed or self.DEFAULT_MOVE_SPEED, self.MIN_STEP_DEG)
         delay = delay or self.DEFAULT_MOVE_DELAY
         
         if current == target:
             return
         
-        direction = 1 if target > current else -1
-        steps = abs(int((target - current) / speed))
+        # Precomputed (and cached) trajectory, so the loop only writes and paces
+        waypoints = _trajectory(current, target, speed)
+        
+        # Pace against a fixed schedule so I2C write time does not add up. The
+        # first waypoint is the current angle, which the servo already holds,
+        # so it is not rewritten. A waypoint whose slot has already passed is
+        # dropped rather than stretching the move; the target is always written.
+        # Loop names bound to locals (LOAD_FAST instead of global/attribute lookups)
+        now = time.perf_counter
+        sleep_until = _sleep_until
+        start = now()
+        last = len(waypoints) - 1
+        for i in range(1, last):
+            slot = start + i * delay
+            if now() >= slot + delay:
+                continue
+            sleep_until(slot)
+            set_func(waypoints[i])
+        sleep_until(start + last * delay)
+        set_func(target)
+    
+    def _move_together(self, plate_target: float, lid_target: float, settle: float = 1.0):
+        """
+        Move plate and lid at the same time, one step each per tick of a shared
+        schedule. Steps outside the collision zone go straight away; a step into
+        it waits until the other servo has been commanded clear of it for
+        `settle` seconds, since servos lag their commands.
         
-        for i in range(steps + 1):
-            angle = current + (direction * speed * i)
-            # Clamp to target
-            if direction > 0:
-                angle = min(angle, target)
+        Args:
+            plate_target: Target plate angle
+            lid_target: Target lid angle
+            settle: Seconds the other servo must have been clear before a step
+                    that depends on it
+        """
+        speed = max(self.DEFAULT_MOVE_SPEED, self.MIN_STEP_DEG)
+        delay = self.DEFAULT_MOVE_DELAY
+        plate_path = deque(_trajectory(self._plate_position, plate_target, speed)[1:])
+        lid_path = deque(_trajectory(self._lid_position, lid_target, speed)[1:])
+        
+        logger.info("Moving plate %s° -> %s° and lid %s° -> %s° together",
+                    self._plate_position, plate_target, self._lid_position, lid_target)
+        
+        enabled = self._collision_enabled
+        start = time.perf_counter()
+        # A servo already clear of the zone before the call has settled there
+        lid_clear_since = plate_clear_since = None
+        if not enabled or self._lid_position <= self.lid_safe_angle:
+            lid_clear_since = start - settle
+        if not enabled or self._plate_position >= self.plate_safe_angle:
+            plate_clear_since = start - settle
+        tick = 0
+        while plate_path or lid_path:
+            now = time.perf_counter()
+            if not enabled or self._lid_position <= self.lid_safe_angle:
+                lid_clear_since = now if lid_clear_since is None else lid_clear_since
             else:
-                angle = max(angle, target)
+                lid_clear_since = None
+            if not enabled or self._plate_position >= self.plate_safe_angle:
+                plate_clear_since = now if plate_clear_since is None else plate_clear_since
+            else:
+                plate_clear_since = None
+            lid_settled = lid_clear_since is not None and now - lid_clear_since >= settle
+            plate_settled = plate_clear_since is not None and now - plate_clear_since >= settle
+            
+            moved = waiting = False
+            if lid_path:
+                if not enabled or lid_path[0] <= self.lid_safe_angle or plate_settled:
+                    self._set_lid_servo(lid_path.popleft())
+                    moved = True
+                    if enabled and self._lid_position > self.lid_safe_angle:
+                        lid_settled = False  # Never both enter the zone on one tick
+                else:
+                    waiting = plate_clear_since is not None
+            if plate_path:
+                if not enabled or plate_path[0] >= self.plate_safe_angle or lid_settled:
+                    self._set_plate_servos(plate_path.popleft())
+                    moved = True
+                else:
+                    waiting = waiting or lid_clear_since is not None
+            if not moved and not waiting:
+                # Each servo needs the other one to move first
+                logger.error("Movement blocked: plate %s° with lid %s° is not reachable "
+                             "from the current position", plate_target, lid_target)
+                break
             
-            set_func(angle)
-            time.sleep(delay)
+            tick += 1
+            _sleep_until(start + tick * delay)
         
-        # Ensure we reach exact target
-        set_func(target)
+        logger.info("Plate at %s°, lid at %s°", self._plate_position, self._lid_position)
+    
+    def _move_axis(self, axis: str, target: float, smooth: bool, action: str,
+                   message: str, *args) -> bool:
+        """
+        Shared driver for plate and lid moves: collision check, log, then a
+        smooth or direct move.
+        
+        Args:
+            axis: 'plate' or 'lid'
+            target: Target angle
+            smooth: If True, move smoothly; if False, move directly
+            action: What is being done, for the blocked message (e.g. "raise plate")
+            message: %-style log message for the move, formatted with args only
+                     if INFO is enabled
+            
+        Returns:
+            True if the move was made, False if it was blocked
+        """
+        get_position, is_safe, set_func = self._axes[axis]
+        if not is_safe(target):
+            logger.error("Movement blocked: Cannot %s to %s°", action, target)
+            return False
+        
+        logger.info(message, *args)
+        if smooth:
+            self._move_smooth(get_position(), target, set_func)
+        else:
+            set_func(target)
+        return True
     
     def raise_plate(self, degrees: Optional[float] = None, smooth: bool = True):
         """
@@ -338,23 +698,9 @@ class PlateLoader:
         else:
             target = max(self._plate_position - degrees, self.PLATE_UP_ANGLE)
         
-        # Check collision safety
-        if not self._check_plate_movement_safe(target):
-            logger.error(f"Movement blocked: Cannot raise plate to {target}°")
-            return
-        
-        logger.info(f"Raising plate from {self._plate_position}° to {target}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._plate_position,
-                target,
-                self._set_plate_servos
-            )
-        else:
-            self._set_plate_servos(target)
-        
-        logger.info("Plate raised successfully")
+        if self._move_axis('plate', target, smooth, "raise plate",
+                           "Raising plate from %s° to %s°", self._plate_position, target):
+            logger.info("Plate raised successfully")
     
     def lower_plate(self, degrees: Optional[float] = None, smooth: bool = True):
         """
@@ -369,23 +715,9 @@ class PlateLoader:
         else:
             target = min(self._plate_position + degrees, self.PLATE_DOWN_ANGLE)
         
-        # Check collision safety
-        if not self._check_plate_movement_safe(target):
-            logger.error(f"Movement blocked: Cannot lower plate to {target}°")
-            return
-        
-        logger.info(f"Lowering plate from {self._plate_position}° to {target}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._plate_position,
-                target,
-                self._set_plate_servos
-            )
-        else:
-            self._set_plate_servos(target)
-        
-        logger.info("Plate lowered successfully")
+        if self._move_axis('plate', target, smooth, "lower plate",
+                           "Lowering plate from %s° to %s°", self._plate_position, target):
+            logger.info("Plate lowered successfully")
     
     def pop_plate(self, smooth: bool = True):
         """
@@ -397,23 +729,9 @@ class PlateLoader:
         """
         target = -5  # Pop up 5 degrees beyond normal upexit position
         
-        # Check collision safety
-        if not self._check_plate_movement_safe(target):
-            logger.error(f"Movement blocked: Cannot pop plate to {target}°")
-            return
-        
-        logger.info(f"Popping plate from {self._plate_position}° to {target}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._plate_position,
-                target,
-                self._set_plate_servos
-            )
-        else:
-            self._set_plate_servos(target)
-        
-        logger.info("Plate popped successfully")
+        if self._move_axis('plate', target, smooth, "pop plate",
+                           "Popping plate from %s° to %s°", self._plate_position, target):
+            logger.info("Plate popped successfully")
     
     def move_plate_to(self, angle: float, smooth: bool = True):
         """
@@ -426,21 +744,7 @@ class PlateLoader:
         # Clamp angle to valid range
         angle = max(self.PLATE_DOWN_ANGLE, min(angle, self.PLATE_UP_ANGLE))
         
-        # Check collision safety
-        if not self._check_plate_movement_safe(angle):
-            logger.error(f"Movement blocked: Cannot move plate to {angle}°")
-            return
-        
-        logger.info(f"Moving plate to {angle}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._plate_position,
-                angle,
-                self._set_plate_servos
-            )
-        else:
-            self._set_plate_servos(angle)
+        self._move_axis('plate', angle, smooth, "move plate", "Moving plate to %s°", angle)
     
     def open_lid(self, smooth: bool = True):
         """
@@ -449,24 +753,9 @@ class PlateLoader:
         Args:
             smooth: If True, move smoothly; if False, move directly
         """
-        # Check collision safety
-        if not self._check_lid_movement_safe(self.LID_OPEN_ANGLE):
-            logger.error(f"Movement blocked: Cannot open lid to {self.LID_OPEN_ANGLE}°")
-            return
-        
-        logger.info(f"Opening lid from {self._lid_position}° to {self.LID_OPEN_ANGLE}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._lid_position,
-                self.LID_OPEN_ANGLE,
-                lambda angle: setattr(self.lid_servo, 'angle', angle)
-            )
-        else:
-            self.lid_servo.angle = self.LID_OPEN_ANGLE
-        
-        self._lid_position = self.LID_OPEN_ANGLE
-        logger.info("Lid opened")
+        if self._move_axis('lid', self.LID_OPEN_ANGLE, smooth, "open lid",
+                           "Opening lid from %s° to %s°", self._lid_position, self.LID_OPEN_ANGLE):
+            logger.info("Lid opened")
     
     def close_lid(self, smooth: bool = True):
         """
@@ -475,24 +764,9 @@ class PlateLoader:
         Args:
             smooth: If True, move smoothly; if False, move directly
         """
-        # Check collision safety
-        if not self._check_lid_movement_safe(self.LID_CLOSED_ANGLE):
-            logger.error(f"Movement blocked: Cannot close lid to {self.LID_CLOSED_ANGLE}°")
-            return
-        
-        logger.info(f"Closing lid from {self._lid_position}° to {self.LID_CLOSED_ANGLE}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._lid_position,
-                self.LID_CLOSED_ANGLE,
-                lambda angle: setattr(self.lid_servo, 'angle', angle)
-            )
-        else:
-            self.lid_servo.angle = self.LID_CLOSED_ANGLE
-        
-        self._lid_position = self.LID_CLOSED_ANGLE
-        logger.info("Lid closed")
+        if self._move_axis('lid', self.LID_CLOSED_ANGLE, smooth, "close lid",
+                           "Closing lid from %s° to %s°", self._lid_position, self.LID_CLOSED_ANGLE):
+            logger.info("Lid closed")
     
     def rotate_lid(self, angle: float, smooth: bool = True):
         """
@@ -505,23 +779,7 @@ class PlateLoader:
         # Clamp angle to valid range
         angle = max(self.LID_OPEN_ANGLE, min(angle, self.LID_CLOSED_ANGLE))
         
-        # Check collision safety
-        if not self._check_lid_movement_safe(angle):
-            logger.error(f"Movement blocked: Cannot rotate lid to {angle}°")
-            return
-        
-        logger.info(f"Rotating lid to {angle}°")
-        
-        if smooth:
-            self._move_smooth(
-                self._lid_position,
-                angle,
-                lambda a: setattr(self.lid_servo, 'angle', a)
-            )
-        else:
-            self.lid_servo.angle = angle
-        
-        self._lid_position = angle
+        self._move_axis('lid', angle, smooth, "rotate lid", "Rotating lid to %s°", angle)
     
     def get_positions(self) -> Tuple[float, float]:
         """
@@ -545,8 +803,7 @@ class PlateLoader:
         
         self.plate_type = plate_type
         plate_config = self.PLATE_TYPES[plate_type]
-        self.plate_safe_angle = plate_config['plate_safe_angle']
-        self.lid_safe_angle = plate_config['lid_safe_angle']
+        self._apply_safe_angles(plate_config)
         
         logger.info(f"Plate type changed to: {plate_type} - {plate_config['description']}")
         if self.plate_safe_angle is not None:
@@ -561,6 +818,13 @@ class PlateLoader:
         Returns:
             Dictionary with plate type info and current safety status
         """
+        # Cached per position; _apply_safe_angles clears it when the plate type
+        # or its limits change
+        key = (self._plate_position, self._lid_position)
+        if self._collision_info is not None and self._collision_info[0] == key:
+            info = self._collision_info[1]
+            return dict(info, warnings=list(info['warnings']))
+        
         plate_config = self.PLATE_TYPES[self.plate_type]
         
         info = {
@@ -575,7 +839,7 @@ class PlateLoader:
         }
         
         # Check current state for collision risk
-        if self.plate_safe_angle is not None:
+        if self._collision_enabled:
             if self._plate_position < self.plate_safe_angle and self._lid_position > self.lid_safe_angle:
                 info['collision_risk'] = True
                 info['warnings'].append(
@@ -584,7 +848,8 @@ class PlateLoader:
                     f"and lid at {self._lid_position}° (> {self.lid_safe_angle}°)"
                 )
         
-        return info
+        self._collision_info = (key, info)
+        return dict(info, warnings=list(info['warnings']))
     
     def print_collision_info(self):
         """Print collision avoidance information in a readable format."""
@@ -643,12 +908,16 @@ class PlateLoader:
         movement = self.config['movement']
         self.DEFAULT_MOVE_SPEED = movement['default_move_speed']
         self.DEFAULT_MOVE_DELAY = movement['default_move_delay']
+        # Optional in older settings files; 0 leaves speeds as given
+        self.MIN_STEP_DEG = movement.get('min_step_deg', 0)
+        # Load cell change that counts as a plate inserted/removed (weight_provider only)
+        self.PLATE_DETECT_GRAMS = movement.get('plate_detect_grams', 5.0)
+        self.PLATE_DETECT_TIMEOUT = movement.get('plate_detect_timeout', 120.0)
         
         # Re-apply current plate type (in case it was updated)
         if self.plate_type in self.PLATE_TYPES:
             plate_config = self.PLATE_TYPES[self.plate_type]
-            self.plate_safe_angle = plate_config['plate_safe_angle']
-            self.lid_safe_angle = plate_config['lid_safe_angle']
+            self._apply_safe_angles(plate_config)
             logger.info(f"Plate type '{self.plate_type}' updated")
         else:
             available_types = list(self.PLATE_TYPES.keys())
@@ -662,7 +931,7 @@ class PlateLoader:
         
         logger.info("Configuration reloaded successfully")
     
-    def load_sequence(self):
+    def load_sequence(self, overlap: bool = True):
         """
         Execute complete plate loading sequence:
         1. Open lid
@@ -670,23 +939,18 @@ class PlateLoader:
         3. Wait for plate insertion
         4. Lower plate
         5. Close lid
+        
+        Args:
+            overlap: Run steps 1-2 and 4-5 together wherever the collision
+                     rules allow (default: True). False runs them one after
+                     the other with fixed settle pauses.
         """
         logger.info("Starting plate loading sequence")
-        
-        self.open_lid(smooth=True)
-        time.sleep(1)
-        
-        self.raise_plate(smooth=True)
-        logger.info("Plate ready for loading. Insert plate and press Enter...")
-        input()  # Wait for user
-        
-        self.lower_plate(smooth=True)
-        time.sleep(0.5)
-        
-        self.close_lid(smooth=True)
+        self._run_sequence("Plate ready for loading. Insert plate and press Enter...", overlap,
+                           weight_delta=self.PLATE_DETECT_GRAMS)
         logger.info("Plate loading sequence complete")
     
-    def unload_sequence(self):
+    def unload_sequence(self, overlap: bool = True):
         """
         Execute complete plate unloading sequence:
         1. Open lid
@@ -694,21 +958,57 @@ class PlateLoader:
         3. Wait for plate removal
         4. Lower plate
         5. Close lid
+        
+        Args:
+            overlap: Run steps 1-2 and 4-5 together wherever the collision
+                     rules allow (default: True). False runs them one after
+                     the other with fixed settle pauses.
         """
         logger.info("Starting plate unloading sequence")
+        self._run_sequence("Plate ready for removal. Remove plate and press Enter...", overlap,
+                           weight_delta=-self.PLATE_DETECT_GRAMS)
+        logger.info("Plate unloading sequence complete")
+    
+    def _run_sequence(self, prompt: str, overlap: bool, weight_delta: float):
+        """Present the plate, wait for the user, then stow it again."""
+        if overlap:
+            self._move_together(self.PLATE_UP_ANGLE, self.LID_OPEN_ANGLE, settle=1.0)
+        else:
+            self.open_lid(smooth=True)
+            time.sleep(1.0)
+            self.raise_plate(smooth=True)
         
-        self.open_lid(smooth=True)
-        time.sleep(1)
-        
-        self.raise_plate(smooth=True)
-        logger.info("Plate ready for removal. Remove plate and press Enter...")
-        input()  # Wait for user
+        # The load cell, if there is one, stands in for the Enter key
+        if self.weight_provider is None or not self._wait_for_weight_change(weight_delta):
+            logger.info(prompt)
+            input()  # Wait for user
         
-        self.lower_plate(smooth=True)
-        time.sleep(0.5)
+        if overlap:
+            self._move_together(self.PLATE_DOWN_ANGLE, self.LID_CLOSED_ANGLE, settle=0.5)
+        else:
+            self.lower_plate(smooth=True)
+            time.sleep(0.5)
+            self.close_lid(smooth=True)
+    
+    def _wait_for_weight_change(self, delta: float, poll: float = 0.05) -> bool:
+        """
+        Wait until the load cell reading moves by delta grams from where it started
+        (positive: plate added, negative: plate removed).
         
-        self.close_lid(smooth=True)
-        logger.info("Plate unloading sequence complete")
+        Returns:
+            True once the change is seen, False if PLATE_DETECT_TIMEOUT expires first
+        """
+        logger.info("Plate ready. Waiting for the load cell to detect the plate...")
+        baseline = self.weight_provider()
+        deadline = time.perf_counter() + self.PLATE_DETECT_TIMEOUT
+        while time.perf_counter() < deadline:
+            change = self.weight_provider() - baseline
+            if (change >= delta) if delta > 0 else (change <= delta):
+                logger.info("Load cell change of %+.1f g detected", change)
+                return True
+            time.sleep(poll)
+        logger.warning("No plate change seen on the load cell within %ss", self.PLATE_DETECT_TIMEOUT)
+        return False
     
     def calibrate(self):
         """
@@ -739,6 +1039,10 @@ class PlateLoader:
         logger.info("Homing all servos...")
         self.lower_plate(smooth=True)
         self.close_lid(smooth=True)
+        # Re-assert both outputs in case the PCA9685 was reset behind our back;
+        # the moves above skip writes for angles we believe are already set
+        self._set_plate_servos(self._plate_position, force=True)
+        self._set_lid_servo(self._lid_position, force=True)
         logger.info("All servos at home position")
     
     def release_plate_motors(self):
@@ -749,6 +1053,7 @@ class PlateLoader:
         logger.info("Releasing plate motors...")
         self.pca.channels[self.PLATE_LIFT_1].duty_cycle = 0
         self.pca.channels[self.PLATE_LIFT_2].duty_cycle = 0
+        self._last_plate_frames = None
         logger.warning("Plate motors unpowered - position not maintained!")
     
     def release_lid_motor(self):
@@ -758,6 +1063,7 @@ class PlateLoader:
         """
         logger.info("Releasing lid motor...")
         self.pca.channels[self.LID_SERVO].duty_cycle = 0
+        self._last_lid_angle = None
         logger.warning("Lid motor unpowered - position not maintained!")
     
     def power_save_mode(self):
@@ -768,18 +1074,21 @@ class PlateLoader:
         logger.info("Entering power save mode...")
         self.pca.channels[self.PLATE_LIFT_1].duty_cycle = 0
         self.pca.channels[self.PLATE_LIFT_2].duty_cycle = 0
+        self._last_plate_frames = None
         self.pca.channels[self.LID_SERVO].duty_cycle = 0
+        self._last_lid_angle = None
         logger.warning("All servos unpowered - position not maintained!")
     
     def power_restore(self):
         """
         Restore power to servos at last known positions.
-        Re-applies the last commanded positions.
+        Re-applies the last commanded positions, always writing the
+        registers, so it can also be called periodically to refresh them.
         """
         logger.info("Restoring servo power...")
-        self._set_plate_servos(self._plate_position)
-        self.lid_servo.angle = self._lid_position
-        logger.info(f"Servos restored: Plate={self._plate_position}°, Lid={self._lid_position}°")
+        self._set_plate_servos(self._plate_position, force=True)
+        self._set_lid_servo(self._lid_position, force=True)
+        logger.info("Servos restored: Plate=%s°, Lid=%s°", self._plate_position, self._lid_position)
     
     def shutdown(self):
         """
@@ -787,7 +1096,10 @@ class PlateLoader:
         """
         logger.info("Shutting down Plate Loader...")
         self.home()
+        self._save_state()
         self.pca.deinit()
+        if self._owns_i2c:
+            self.i2c.deinit()
         logger.info("Plate Loader shutdown complete")
 
 
@@ -23,27 +23,39 @@ Simple Usage:
     doser.shutdown()
 """
 
+import asyncio
+import atexit
+import queue
+import threading
 import time
 import logging
+import logging.handlers
 from typing import Optional
 
 try:
     from adafruit_pca9685 import PCA9685
-    from adafruit_motor import servo
     import board, busio
     import RPi.GPIO as GPIO
 except ImportError as e:
     print("Required libraries not installed. On Raspberry Pi, run:")
-    print("  pip install adafruit-circuitpython-pca9685 adafruit-circuitpython-motor")
+    print("  pip install adafruit-circuitpython-pca9685")
     print("  pip install rpi-lgpio  # Required for Raspberry Pi 5")
     raise e
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging. As with a plain basicConfig() this only applies when the
+# application hasn't set up logging itself. Records are handed to a background
+# listener, so a slow console (SSH, journald) can't stretch a dispense.
+if not logging.getLogger().handlers:
+    _log_queue = queue.Queue()
+    _log_output = logging.StreamHandler()
+    _log_output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # Flush what is still queued
+    _log_input = logging.handlers.QueueHandler(_log_queue)
+    _log_input.setFormatter(logging.Formatter('%(message)s'))  # Full format applied by the listener
+    logging.basicConfig(level=logging.INFO, handlers=[_log_input])
 logger = logging.getLogger(__name__)
 
 
@@ -84,15 +96,21 @@ class SolidDoser:
     GATE_CONTACT = 0            # Pin touching gate (servo 65°)
     GATE_MAX_CONTRACTION = -20  # Maximum contraction from contact (servo 85°)
     
+    # Gate servo pulse range (microseconds)
+    SERVO_MIN_PULSE = 500
+    SERVO_MAX_PULSE = 2500
+    
     # Power management delays
     MOTOR_STARTUP_DELAY = 0.5  # Wait for motor to reach steady state
-    SERVO_MOVE_DELAY = 0.5     # Wait between servo movements
+    SERVO_MOVE_DELAY = 0.5     # Wait after a full gate sweep (shorter moves scale down)
+    SERVO_MIN_SETTLE = 0.05    # Shortest wait after any gate move
     
     def __init__(
         self, 
         i2c_address: int = 0x40, 
         motor_gpio_pin: int = 17, 
-        frequency: int = 50
+        frequency: int = 50,
+        i2c=None
         ):
         """
         Initialize the solid doser controller.
@@ -100,28 +118,42 @@ class SolidDoser:
             i2c_address: I2C address of PCA9685 (default 0x40 for Waveshare HAT)
             motor_gpio_pin: GPIO pin (BCM) for relay control (default 17)
             frequency: PWM frequency in Hz (default 50 for servos)
+            i2c: Existing busio.I2C bus to use, e.g. one shared with a PlateLoader
+                 (default: open a new one, closed again by shutdown())
         """
         logger.info("Initializing Solid Doser...")
         
-        # Store GPIO pin (setup happens in motor_on)
+        # Configure the relay pin once, motor off; motor_on/motor_off only toggle it
         self.dc_relay_pin = motor_gpio_pin
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setwarnings(False)
+        # Active HIGH: HIGH=ON, LOW=OFF
+        self._relay_on = GPIO.HIGH if self.RELAY_NO else GPIO.LOW
+        self._relay_off = GPIO.LOW if self.RELAY_NO else GPIO.HIGH
+        GPIO.setup(self.dc_relay_pin, GPIO.OUT, initial=self._relay_off)
+        
+        # Set by abort() to cut short any wait in progress
+        self._abort = threading.Event()
         
-        # Initialize I2C bus
-        self.i2c = busio.I2C(board.SCL, board.SDA)
+        # Initialize I2C bus, unless the caller shares theirs
+        self._owns_i2c = i2c is None
+        self.i2c = busio.I2C(board.SCL, board.SDA) if i2c is None else i2c
         
         # Initialize PCA9685
         self.pca = PCA9685(self.i2c, address=i2c_address)
         self.pca.frequency = frequency
         
-        # Initialize gate servo
-        self.gate_servo = servo.Servo(
-            self.pca.channels[self.GATE_SERVO],
-            min_pulse=500,
-            max_pulse=2500
+        # LEDn register frame for every whole gate position, precomputed so a
+        # gate move is a table lookup and one auto-increment I2C write
+        self._gate_frames = tuple(
+            self._gate_frame(position)
+            for position in range(self.GATE_MAX_CONTRACTION, self.GATE_MAX_EXTENSION + 1)
         )
+        self._closed_frame = self._gate_frames[0]
         
         # Current positions/states (in user coordinates)
-        self._gate_position = self.GATE_MAX_CONTRACTION  # Start contracted (closed)
+        self._gate_position = None  # Unknown until the first move below closes it
+        self._gate_settled_at = 0.0  # perf_counter time the last gate move is done
         self._motor_running = False
         
         # Initialize to safe state
@@ -164,6 +196,34 @@ class SolidDoser:
         
         return servo_angle
     
+    def _servo_angle_to_duty(self, servo_angle: float) -> int:
+        """
+        Convert a servo angle to the 16-bit PCA9685 duty cycle, using the same
+        mapping as adafruit_motor.servo (0-180° across the pulse range).
+        """
+        frequency = self.pca.frequency
+        min_duty = int(self.SERVO_MIN_PULSE * frequency / 1000000 * 0xFFFF)
+        max_duty = int(self.SERVO_MAX_PULSE * frequency / 1000000 * 0xFFFF)
+        return min_duty + int(servo_angle / 180 * (max_duty - min_duty))
+    
+    def _gate_frame(self, gate_position: float) -> bytes:
+        """
+        LED0_ON_L..OFF_H write for a (clamped) gate position: the start
+        register followed by ON = 0 and the OFF count, with the same
+        conversion as PCA9685 PWMChannel.duty_cycle.
+        """
+        off = (self._servo_angle_to_duty(self._gate_to_servo_angle(gate_position)) + 1) >> 4
+        return bytes((0x06 + 4 * self.GATE_SERVO, 0, 0, off & 0xFF, off >> 8))
+    
+    def _write_gate(self, gate_position: float):
+        """Write a gate position, from the table for whole positions."""
+        if gate_position == int(gate_position):
+            frame = self._gate_frames[int(gate_position) - self.GATE_MAX_CONTRACTION]
+        else:
+            frame = self._gate_frame(gate_position)
+        with self.pca.i2c_device as i2c:
+            i2c.write(frame)
+    
     def _servo_to_gate_angle(self, servo_angle: float) -> float:
         """
         Convert servo angle to user-friendly gate position.
@@ -176,34 +236,109 @@ class SolidDoser:
         """
         return self.SERVO_CONTACT_POINT - servo_angle
     
+    def _wait_until(self, deadline: float) -> bool:
+        """
+        Wait until time.perf_counter() reaches deadline, or until abort() is
+        called. The wait is on an Event so another thread can interrupt it,
+        and the last millisecond is spun since timed waits overshoot on Linux.
+        
+        Returns:
+            True if the wait was cut short by abort()
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining > 0.002 and self._abort.wait(remaining - 0.001):
+            return True
+        while time.perf_counter() < deadline:
+            pass
+        return self._abort.is_set()
+    
+    def _power_wait(self, seconds: float) -> bool:
+        """
+        Interruptible delay (power-safe settling, dispense windows).
+        
+        Returns:
+            True if the wait was cut short by abort()
+        """
+        return self._wait_until(time.perf_counter() + seconds)
+    
+    def abort(self):
+        """
+        Interrupt the current dispense, purge or calibration from another
+        thread. Any wait in progress ends immediately and the remaining steps
+        are skipped; the gate then closes and the motor stops, with the usual
+        settle. The abort is cleared when that operation finishes.
+        """
+        logger.warning("Abort requested")
+        self._abort.set()
+    
+    async def _run_in_thread(self, func, *args):
+        """
+        Run a blocking operation in the event loop's default executor, so the
+        loop keeps serving other tasks. Cancelling the awaiting task aborts
+        the operation and waits for it to finish shutting the gate and motor.
+        """
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+        
+        def run():
+            # Cancelled while still queued in the executor: never start
+            if not cancelled.is_set():
+                return func(*args)
+        
+        future = loop.run_in_executor(None, run)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            self.abort()
+            # The operation clears the abort flag as it starts, so keep
+            # re-asserting it until the operation has wound down
+            while not future.done():
+                self._abort.set()
+                await asyncio.wait({future}, timeout=0.05)
+            self._abort.clear()
+            raise
+    
+    async def adispense(self, duration: float, gate_position: Optional[float] = None):
+        """Awaitable dispense(); cancelling it aborts the dispense."""
+        await self._run_in_thread(self.dispense, duration, gate_position)
+    
+    async def apurge(self, duration: float = 2.0):
+        """Awaitable purge(); cancelling it aborts the purge."""
+        await self._run_in_thread(self.purge, duration)
+    
+    async def acalibrate(self):
+        """Awaitable calibrate(); cancelling it aborts the calibration."""
+        await self._run_in_thread(self.calibrate)
+    
     def motor_on(self):
         """
         Turn DC motor ON via relay.
-        Sets up GPIO and turns motor on.
+        Power-safe: waits for a gate move still in progress to settle first,
+        so servo and motor inrush currents never overlap.
         """
         if not self._motor_running:
+            if self._wait_until(self._gate_settled_at) and time.perf_counter() < self._gate_settled_at:
+                # Aborted while the gate was still moving: starting now would
+                # put the motor inrush on top of the servo's
+                logger.warning("Motor start aborted")
+                return
             logger.info("Starting motor...")
-            # Setup GPIO and turn ON
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
-            # Active HIGH: HIGH=ON, LOW=OFF
-            on_state = GPIO.HIGH if self.RELAY_NO else GPIO.LOW
-            GPIO.setup(self.dc_relay_pin, GPIO.OUT, initial=on_state)
+            GPIO.output(self.dc_relay_pin, self._relay_on)
             self._motor_running = True
-            logger.info(f"Waiting {self.MOTOR_STARTUP_DELAY}s for motor to reach steady state...")
-            time.sleep(self.MOTOR_STARTUP_DELAY)
+            logger.info("Waiting %ss for motor to reach steady state...", self.MOTOR_STARTUP_DELAY)
+            self._power_wait(self.MOTOR_STARTUP_DELAY)
             logger.info("Motor running at steady state")
     
     def motor_off(self):
         """
         Turn DC motor OFF via relay.
-        Uses GPIO.cleanup() to reset pin and turn off motor.
         """
         logger.info("Stopping motor...")
-        GPIO.cleanup()
+        GPIO.output(self.dc_relay_pin, self._relay_off)
         self._motor_running = False
     
-    def open_gate(self, gate_position: Optional[float] = None):
+    def open_gate(self, gate_position: Optional[float] = None, settle: Optional[float] = None):
         """
         Open the hopper gate by extending the pin to allow solid flow.
         Power-safe: Includes delay after movement.
@@ -212,30 +347,43 @@ class SolidDoser:
             gate_position: Gate position in user coordinates (None = fully extended to 35)
                           Positive values extend the pin (0 to 35)
                           0 = contact point (servo 65°)
+            settle: Seconds to wait after the move (default: scaled to the
+                    distance moved, see _finish_gate_move); 0 lets the caller
+                    do its own pacing
         """
         target = gate_position if gate_position is not None else self.GATE_MAX_EXTENSION
         target = max(self.GATE_CONTACT, min(target, self.GATE_MAX_EXTENSION))
+        if target == self._gate_position:
+            logger.debug("Gate already at position %s", target)
+            return
         
         servo_angle = self._gate_to_servo_angle(target)
-        logger.info(f"Opening gate to position {target} (servo {servo_angle}°)")
-        self.gate_servo.angle = servo_angle
-        self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)  # Power-safe delay
+        logger.info("Opening gate to position %s (servo %s°)", target, servo_angle)
+        self._write_gate(target)
+        self._finish_gate_move(target, settle)
     
-    def close_gate(self):
+    def close_gate(self, settle: Optional[float] = None):
         """
         Close the hopper gate by contracting the pin to stop solid flow.
         Contracts to position -20 (servo 85°).
         Power-safe: Includes delay after movement.
+        
+        Args:
+            settle: Seconds to wait after the move (default: scaled to the
+                    distance moved, see _finish_gate_move); 0 lets the caller
+                    do its own pacing
         """
         target = self.GATE_MAX_CONTRACTION
+        # Write the cached frame first so the gate shuts without any
+        # angle conversion or logging in front of it. Always written, even if
+        # already closed: this is the safe state home() and shutdown() rely on
+        with self.pca.i2c_device as i2c:
+            i2c.write(self._closed_frame)
         servo_angle = self._gate_to_servo_angle(target)
-        logger.info(f"Closing gate from position {self._gate_position} to {target} (servo {servo_angle}°)")
-        self.gate_servo.angle = servo_angle
-        self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)  # Power-safe delay
+        logger.info("Closed gate from position %s to %s (servo %s°)", self._gate_position, target, servo_angle)
+        self._finish_gate_move(target, settle)
     
-    def set_gate_position(self, gate_position: float):
+    def set_gate_position(self, gate_position: float, settle: Optional[float] = None):
         """
         Set gate to a specific position for precise flow control.
         Power-safe: Includes delay after movement.
@@ -244,13 +392,51 @@ class SolidDoser:
             gate_position: Target position in user coordinates
                           Range: -20 (fully contracted, servo 85°) to 35 (fully extended, servo 30°)
                           0 = contact point (servo 65°)
+            settle: Seconds to wait after the move (default: scaled to the
+                    distance moved, see _finish_gate_move); 0 lets the caller
+                    do its own pacing
         """
         target = max(self.GATE_MAX_CONTRACTION, min(gate_position, self.GATE_MAX_EXTENSION))
+        if target == self._gate_position:
+            logger.debug("Gate already at position %s", target)
+            return
         servo_angle = self._gate_to_servo_angle(target)
-        logger.info(f"Setting gate to position {target} (servo {servo_angle}°)")
-        self.gate_servo.angle = servo_angle
+        logger.info("Setting gate to position %s (servo %s°)", target, servo_angle)
+        self._write_gate(target)
+        self._finish_gate_move(target, settle)
+    
+    def _finish_gate_move(self, target: float, settle: Optional[float]):
+        """
+        Record a gate move and wait for it to settle. The servo's travel time,
+        and its current draw, scale with the distance moved, so the settle time
+        does too: SERVO_MOVE_DELAY for a full sweep, down to SERVO_MIN_SETTLE.
+        A servo that was already at the target has nothing to settle, and a
+        move from an unknown position counts as a full sweep.
+        """
+        if target == self._gate_position:
+            return
+        if self._gate_position is None:
+            travel = 1.0
+        else:
+            travel = abs(target - self._gate_position) / (self.GATE_MAX_EXTENSION - self.GATE_MAX_CONTRACTION)
+        move_time = max(self.SERVO_MIN_SETTLE, self.SERVO_MOVE_DELAY * travel)
         self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)  # Power-safe delay
+        self._gate_settled_at = time.perf_counter() + move_time
+        self._power_wait(move_time if settle is None else settle)  # Power-safe delay
+    
+    def _finish_operation(self):
+        """
+        Close the gate and stop the motor at the end of a dispense, purge or
+        calibration, whether it completed or was aborted. The gate closes
+        first and the motor stops while it travels (switching off draws no
+        current); the settle is a plain sleep so an abort can't cut it short.
+        """
+        self.close_gate(settle=0)
+        self.motor_off()
+        remaining = self._gate_settled_at - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._abort.clear()
     
     def dispense(self, duration: float, gate_position: Optional[float] = None):
         """
@@ -268,29 +454,32 @@ class SolidDoser:
             gate_position: Gate position in user coordinates (None = fully extended to 35)
                           Range: 0 (contact) to 35 (fully extended)
         """
-        logger.info(f"Starting dispense: {duration}s")
+        logger.info("Starting dispense: %ss", duration)
+        self._abort.clear()
         
         try:
             # Step 1: Start motor (includes startup delay)
             self.motor_on()
             
-            # Step 2: Open gate (motor already at steady state)
-            if gate_position is not None:
-                self.open_gate(gate_position)
-            else:
-                self.open_gate()
-            
-            # Step 3: Dispense for specified duration
-            logger.info(f"Dispensing for {duration}s...")
-            time.sleep(duration)
+            # Steps 2-3: Open gate (motor already at steady state) and dispense.
+            # The window runs from the gate write to the close, so the gate is
+            # open for duration; the servo's settle time falls inside it
+            if not self._abort.is_set():
+                deadline = time.perf_counter() + duration
+                self.open_gate(gate_position, settle=0)
+                logger.info("Dispensing for %ss...", duration)
+                self._wait_until(deadline)
+            aborted = self._abort.is_set()
             
         finally:
             # Always close gate and stop motor, even if interrupted
             logger.info("Stopping dispense...")
-            self.close_gate()
-            self.motor_off()
-            
-        logger.info("Dispense complete")
+            self._finish_operation()
+        
+        if aborted:
+            logger.warning("Dispense aborted")
+        else:
+            logger.info("Dispense complete")
     
     def purge(self, duration: float = 2.0):
         """
@@ -300,17 +489,22 @@ class SolidDoser:
         Args:
             duration: Purge duration in seconds
         """
-        logger.info(f"Purging for {duration}s")
+        logger.info("Purging for %ss", duration)
+        self._abort.clear()
         
         try:
             self.motor_on()
-            self.open_gate()
-            time.sleep(duration)
+            if not self._abort.is_set():
+                self.open_gate()
+                self._power_wait(duration)
+            aborted = self._abort.is_set()
         finally:
-            self.close_gate()
-            self.motor_off()
+            self._finish_operation()
         
-        logger.info("Purge complete")
+        if aborted:
+            logger.warning("Purge aborted")
+        else:
+            logger.info("Purge complete")
     
     def calibrate(self):
         """
@@ -319,26 +513,41 @@ class SolidDoser:
         Tests: fully contracted (-20), contact (0), half extension (15), fully extended (35).
         """
         logger.info("Starting solid doser calibration...")
+        self._abort.clear()
         
-        # Test gate
+        # Test gate. Each position is held for 1 s from when it was commanded,
+        # on one timeline, rather than the gate's own settle plus a pause.
+        # The last close keeps the power-safe settle before the motor starts.
         logger.info("Testing gate servo...")
-        self.close_gate()  # Fully contracted (-20, servo 85°)
-        time.sleep(1)
-        self.set_gate_position(self.GATE_CONTACT)  # Contact point (0, servo 65°)
-        time.sleep(1)
-        self.set_gate_position(15)  # Half extension (servo 50°)
-        time.sleep(1)
-        self.open_gate()  # Fully extended (35, servo 30°)
-        time.sleep(1)
-        self.close_gate()
-        
-        # Test motor
-        logger.info("Testing motor (3 seconds)...")
-        self.motor_on()
-        time.sleep(3)
-        self.motor_off()
+        steps = (
+            (self.close_gate, (), 1.0),                           # Fully contracted (-20, servo 85°)
+            (self.set_gate_position, (self.GATE_CONTACT,), 1.0),  # Contact point (0, servo 65°)
+            (self.set_gate_position, (15,), 1.0),                 # Half extension (servo 50°)
+            (self.open_gate, (), 1.0),                            # Fully extended (35, servo 30°)
+            (self.close_gate, (), self.SERVO_MOVE_DELAY),
+        )
+        try:
+            deadline = time.perf_counter()
+            for move, args, hold in steps:
+                if self._abort.is_set():
+                    break
+                move(*args, settle=0)
+                deadline += hold
+                self._wait_until(deadline)
+            
+            # Test motor
+            if not self._abort.is_set():
+                logger.info("Testing motor (3 seconds)...")
+                self.motor_on()
+                self._power_wait(3)
+            aborted = self._abort.is_set()
+        finally:
+            self._finish_operation()
         
-        logger.info("Calibration complete")
+        if aborted:
+            logger.warning("Calibration aborted")
+        else:
+            logger.info("Calibration complete")
     
     def get_status(self) -> dict:
         """
@@ -359,7 +568,7 @@ class SolidDoser:
         """
         logger.info("Homing solid doser...")
         self.motor_off()
-        time.sleep(0.5)
+        self._power_wait(0.5)
         self.close_gate()
         logger.info("Solid doser at home position")
     
@@ -368,8 +577,12 @@ class SolidDoser:
         Safely shutdown the controller.
         """
         logger.info("Shutting down Solid Doser...")
-        self.home()  # This calls motor_off() which does GPIO.cleanup()
+        self._abort.set()  # Don't wait out power-safe delays on the way down
+        self.home()
+        GPIO.cleanup(self.dc_relay_pin)  # Only our pin; leave the host's other GPIOs alone
         self.pca.deinit()
+        if self._owns_i2c:
+            self.i2c.deinit()
         logger.info("Solid Doser shutdown complete")
 
 
@@ -12,10 +12,10 @@ Hardware:
 
 import time
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import RPi.GPIO as GPIO
-from smbus2 import SMBus
+from smbus2 import SMBus, i2c_msg
 
 # -------- Minimal PCA9685 driver (no Adafruit) --------
 class PCA9685Lite:
@@ -48,27 +48,44 @@ class PCA9685Lite:
         """Set PWM frequency; typical for servos is ~50Hz."""
         # prescale = round(25MHz / (4096 * freq)) - 1
         prescale = int(round(25000000.0 / (4096.0 * freq_hz)) - 1)
+        self.frequency = freq_hz
+        self._us_to_ticks = 4096.0 * freq_hz / 1_000_000.0  # 12-bit counts per microsecond
         oldmode = self._read8(self._MODE1)
         sleep = (oldmode & ~self._RESTART) | self._SLEEP
-        self._write8(self._MODE1, sleep)           # go to sleep
-        self._write8(self._PRESCALE, prescale)     # set prescale
-        self._write8(self._MODE1, oldmode)         # wake
+        # sleep, set prescale, wake: one combined transfer (repeated starts)
+        self.bus.i2c_rdwr(
+            i2c_msg.write(self.address, [self._MODE1, sleep & 0xFF]),
+            i2c_msg.write(self.address, [self._PRESCALE, prescale & 0xFF]),
+            i2c_msg.write(self.address, [self._MODE1, oldmode & 0xFF]),
+        )
         time.sleep(0.005)
         self._write8(self._MODE1, oldmode | self._RESTART | self._AI)
 
     def set_pwm(self, channel: int, on: int, off: int):
         """Set 12-bit on/off counts for a channel (0..4095)."""
-        base = self._LED0_ON_L + 4 * channel
-        self._write8(base + 0, on & 0xFF)
-        self._write8(base + 1, (on >> 8) & 0x0F)
-        self._write8(base + 2, off & 0xFF)
-        self._write8(base + 3, (off >> 8) & 0x0F)
-
-    def set_pwm_us(self, channel: int, pulse_us: float, freq_hz: int):
-        """Convenience: set PWM by microseconds at given frequency."""
-        period_us = 1_000_000.0 / freq_hz
+        # One block transfer; MODE1 auto-increment walks ON_L..OFF_H
+        self.bus.write_i2c_block_data(self.address, self._LED0_ON_L + 4 * channel,
+                                      self._pwm_bytes(on, off))
+
+    def set_pwm_all(self, values: List[Tuple[int, int]]):
+        """Set (on, off) counts for channels 0..len(values)-1 in one transfer."""
+        if len(values) > 16:
+            raise ValueError(f"PCA9685 has 16 channels, got {len(values)} values")
+        # SMBus block writes stop at 32 bytes, so use a raw I2C write for 16 channels
+        data = [self._LED0_ON_L]
+        for on, off in values:
+            data.extend(self._pwm_bytes(on, off))
+        self.bus.i2c_rdwr(i2c_msg.write(self.address, data))
+
+    @staticmethod
+    def _pwm_bytes(on: int, off: int) -> List[int]:
+        return [on & 0xFF, (on >> 8) & 0x0F, off & 0xFF, (off >> 8) & 0x0F]
+
+    def set_pwm_us(self, channel: int, pulse_us: float, freq_hz: Optional[int] = None):
+        """Convenience: set PWM by microseconds (freq_hz defaults to the configured frequency)."""
         # 12-bit resolution across the period
-        ticks = int(round((pulse_us / period_us) * 4096.0))
+        us_to_ticks = self._us_to_ticks if freq_hz is None else 4096.0 * freq_hz / 1_000_000.0
+        ticks = int(round(pulse_us * us_to_ticks))
         ticks = max(0, min(4095, ticks))
         self.set_pwm(channel, 0, ticks)
 
@@ -81,13 +98,29 @@ class PCA9685Lite:
 # -------- Tiny servo helper (angle -> pulse width) --------
 class ServoLite:
     def __init__(self, pca: PCA9685Lite, channel: int, freq_hz: int = 50,
-                 min_pulse: int = 500, max_pulse: int = 2500):
+                 min_pulse: int = 500, max_pulse: int = 2500,
+                 speed_dps: float = 300.0, min_settle: float = 0.02):
         self.pca = pca
         self.channel = channel
         self.freq_hz = freq_hz
         self.min_pulse = min_pulse
         self.max_pulse = max_pulse
+        self.speed_dps = speed_dps      # rated speed, degrees per second
+        self.min_settle = min_settle
         self._angle = None
+        self._settle_time = 0.0
+        self._us_to_ticks = 4096.0 * freq_hz / 1_000_000.0  # 12-bit counts per microsecond
+        # Ticks for each whole degree 0..180, so the common case is one lookup
+        self._ticks = tuple(self._pulse_to_ticks(self._degrees_to_pulse(d)) for d in range(181))
+
+    def _degrees_to_pulse(self, degrees: float) -> float:
+        # linear map to pulse width
+        return self.min_pulse + (self.max_pulse - self.min_pulse) * (degrees / 180.0)
+
+    def _pulse_to_ticks(self, pulse_us: float) -> int:
+        # 12-bit resolution across the period
+        ticks = int(round(pulse_us * self._us_to_ticks))
+        return max(0, min(4095, ticks))
 
     @property
     def angle(self) -> Optional[float]:
@@ -97,11 +130,37 @@ class ServoLite:
     def angle(self, degrees: float):
         # clamp 0..180
         degrees = max(0.0, min(180.0, float(degrees)))
-        # linear map to pulse width
-        pulse = self.min_pulse + (self.max_pulse - self.min_pulse) * (degrees / 180.0)
-        self.pca.set_pwm_us(self.channel, pulse, self.freq_hz)
+        if degrees == self._angle:
+            self._settle_time = 0.0  # already there: no write, nothing to wait for
+            return
+        if degrees.is_integer():
+            ticks = self._ticks[int(degrees)]
+        else:
+            ticks = self._pulse_to_ticks(self._degrees_to_pulse(degrees))
+        self.pca.set_pwm(self.channel, 0, ticks)
+        # travel time at rated speed; unknown start position = full sweep
+        delta = 180.0 if self._angle is None else abs(degrees - self._angle)
+        self._settle_time = max(self.min_settle, delta / self.speed_dps)
         self._angle = degrees
 
+    def wait_settled(self):
+        """Sleep for the travel time of the last move."""
+        time.sleep(self._settle_time)
+
+    def ramp_to(self, degrees_end: float, duration_s: float, steps: int = 50):
+        """Move to degrees_end in evenly spaced steps over duration_s."""
+        if steps < 1:
+            raise ValueError(f"steps must be at least 1, got {steps}")
+        start = self._angle if self._angle is not None else degrees_end
+        step_time = duration_s / steps
+        # absolute deadlines, so per-step write time doesn't add up as drift
+        t0 = time.monotonic()
+        for i in range(1, steps + 1):
+            self.angle = start + (degrees_end - start) * i / steps
+            remaining = t0 + i * step_time - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+
 # -------- Your original controller, lightly adapted --------
 logging.basicConfig(
     level=logging.INFO,
@@ -129,7 +188,6 @@ class SolidDoser:
     GATE_MAX_CONTRACTION = -20
 
     MOTOR_STARTUP_DELAY = 0.5
-    SERVO_MOVE_DELAY    = 0.3
 
     def __init__(self, i2c_address: int = 0x40, motor_gpio_pin: int = 17, frequency: int = 50):
         logger.info("Initializing Solid Doser (no Adafruit deps)...")
@@ -190,7 +248,7 @@ class SolidDoser:
         logger.info(f"Opening gate to {target} (servo {servo_angle}°)")
         self.gate_servo.angle = servo_angle
         self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)
+        self.gate_servo.wait_settled()
 
     def close_gate(self):
         target = self.GATE_MAX_CONTRACTION
@@ -198,7 +256,7 @@ class SolidDoser:
         logger.info(f"Closing gate to {target} (servo {servo_angle}°)")
         self.gate_servo.angle = servo_angle
         self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)
+        self.gate_servo.wait_settled()
 
     def set_gate_position(self, gate_position: float):
         target = max(self.GATE_MAX_CONTRACTION, min(gate_position, self.GATE_MAX_EXTENSION))
@@ -206,7 +264,7 @@ class SolidDoser:
         logger.info(f"Setting gate to {target} (servo {servo_angle}°)")
         self.gate_servo.angle = servo_angle
         self._gate_position = target
-        time.sleep(self.SERVO_MOVE_DELAY)
+        self.gate_servo.wait_settled()
 
     def dispense(self, duration: float, gate_position: Optional[float] = None):
         logger.info(f"Starting dispense: {duration}s")
@@ -0,0 +1,69 @@
+"""
+Well Plate Coordinates
+Computes CNC coordinates for every well on a microplate.
+
+The grid is described by the position of well A1 and the pitch between
+neighbouring wells, e.g. for a standard 96-well plate:
+
+    wells = get_well_dict(8, 12, a1_x=10.0, a1_y=10.0, dx=9.0, dy=9.0)
+    x, y = wells['B3']
+
+Pass serpentine=True to visit the wells in boustrophedon order, which
+saves (num_cols - 1) * dx of travel at every row change. For a run loop,
+well_traversal() flattens the dict into (name, x, y) tuples once.
+"""
+
+import string
+
+
+def _row_label(row: int) -> str:
+    """Row letters as printed on plates: A..Z, then AA, AB, ... (1536-well)"""
+    letters = string.ascii_uppercase
+    if row < len(letters):
+        return letters[row]
+    return letters[row // len(letters) - 1] + letters[row % len(letters)]
+
+
+def get_well_dict(num_rows: int, num_cols: int, a1_x: float, a1_y: float,
+                  dx: float, dy: float, serpentine: bool = False) -> dict:
+    """
+    Map well names to XY coordinates.
+
+    Args:
+        num_rows: Number of rows (8 for a 96-well plate)
+        num_cols: Number of columns (12 for a 96-well plate)
+        a1_x: X coordinate of well A1 (mm)
+        a1_y: Y coordinate of well A1 (mm)
+        dx: Column pitch along X (mm)
+        dy: Row pitch along Y (mm)
+        serpentine: If True, order wells back and forth (A1..A12, B12..B1, C1..)
+                    so iterating the dict never makes a full-width return move
+
+    Returns:
+        Dictionary of well name -> (x, y), in visiting order starting at A1
+    """
+    # Each axis and its labels are computed once; the grid is just their pairing
+    xs = [(str(col + 1), a1_x + col * dx) for col in range(num_cols)]
+    rows = [(_row_label(row), a1_y + row * dy) for row in range(num_rows)]
+    reversed_xs = xs[::-1]
+    return {
+        letter + number: (x, y)
+        for row, (letter, y) in enumerate(rows)
+        for number, x in (reversed_xs if serpentine and row % 2 else xs)
+    }
+
+
+def well_traversal(wells: dict) -> list:
+    """
+    Flatten a well dict into a list of (name, x, y) tuples in visiting order.
+
+    Building it once avoids a key list copy and a dict lookup per well in the
+    run loop, e.g. to skip A1: ``for name, x, y in traversal[1:]:``
+
+    Args:
+        wells: Dictionary returned by get_well_dict()
+
+    Returns:
+        List of (name, x, y) tuples
+    """
+    return [(name, x, y) for name, (x, y) in wells.items()]